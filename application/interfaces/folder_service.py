@@ -1,47 +1,45 @@
-from abc import ABC, abstractmethod
-from typing import List, Optional, Tuple
+from typing import List, Optional, Tuple, Protocol
 
 from domain.entities.folder import Folder
 
-class FolderService(ABC):
+class FolderService(Protocol):
     """Interface for folder-related use cases."""
     
-    @abstractmethod
     def get_all_folders(self) -> List[Folder]:
         """Get all folders."""
-        pass
     
-    @abstractmethod
     def get_folder_by_id(self, folder_id: int) -> Optional[Folder]:
         """Get a folder by its ID."""
-        pass
     
-    @abstractmethod
+    def get_folders_by_ids(self, folder_ids: List[int]) -> List[Folder]:
+        """Get the folders matching the given IDs, in the order of the IDs."""
+    
     def get_folder_hierarchy(self) -> List[Tuple[Folder, int]]:
         """Get the folder hierarchy as a list of (folder, depth) tuples."""
-        pass
     
-    @abstractmethod
+    def get_descendants(self, folder_id: int) -> List[Folder]:
+        """Get all folders nested below a folder, at any depth."""
+    
+    def get_folder_subtree(self, root_id: int) -> List[Folder]:
+        """Get a folder together with all folders nested below it."""
+    
+    def get_ancestors(self, folder_id: int) -> List[Folder]:
+        """Get the folders above a folder, nearest parent first."""
+    
+    def get_hierarchy_with_counts(self) -> List[Tuple[Folder, int, int]]:
+        """Get the folder hierarchy as a list of (folder, depth, note_count) tuples."""
+    
     def create_folder(self, name: str, parent_id: Optional[int] = None) -> int:
         """Create a new folder and return its ID."""
-        pass
     
-    @abstractmethod
     def rename_folder(self, folder_id: int, new_name: str) -> bool:
         """Rename a folder and return success status."""
-        pass
     
-    @abstractmethod
     def delete_folder(self, folder_id: int) -> bool:
         """Delete a folder and return success status."""
-        pass
     
-    @abstractmethod
     def move_folder(self, folder_id: int, new_parent_id: Optional[int]) -> bool:
         """Move a folder to a new parent and return success status."""
-        pass
     
-    @abstractmethod
     def get_folder_note_count(self, folder_id: int) -> int:
-        """Get the number of notes in a folder."""
-        pass
\ No newline at end of file
+        """Get the number of notes in a folder."""
\ No newline at end of file
@@ -1,37 +1,48 @@
 import os
+import stat
 import subprocess
+import sys
 from datetime import datetime
+from pathlib import PurePath
 from typing import List, Optional
 
 from domain.entities.attachment import Attachment
 from domain.repositories.attachment_repository import AttachmentRepository
-from application.interfaces.attachment_service import AttachmentService
 
-class AttachmentServiceImpl(AttachmentService):
+def _launch_detached(command: str, path: str) -> None:
+    """Launch an opener without waiting for it to exit."""
+    subprocess.Popen(
+        [command, path],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True
+    )
+
+# Pick the system opener once; the platform cannot change while the app is running
+if os.name == 'nt':
+    _open_file = os.startfile
+elif sys.platform == 'darwin':
+    _open_file = lambda path: _launch_detached('open', path)
+else:
+    _open_file = lambda path: _launch_detached('xdg-open', path)
+
+class AttachmentServiceImpl:
     """Implementation of the attachment service use cases."""
     
     def __init__(self, attachment_repository: AttachmentRepository):
         self.attachment_repository = attachment_repository
+        self.get_attachment_by_id = attachment_repository.get_attachment_by_id
     
     def get_attachments_for_note(self, note_id: int) -> List[Attachment]:
         """Get all attachments for a specific note."""
         return self.attachment_repository.get_attachments_for_note(note_id)
     
-    def get_attachment_by_id(self, attachment_id: int) -> Optional[Attachment]:
-        """Get an attachment by its ID."""
-        # This method might not be directly available in the repository
-        # We can implement it by filtering the results of get_attachments_for_note
-        attachments = self.attachment_repository.get_attachments_for_note(None)  # Get all attachments
-        for attachment in attachments:
-            if attachment.id == attachment_id:
-                return attachment
-        return None
-    
     def add_attachment(self, note_id: int, file_path: str) -> int:
         """Add a new attachment to a note and return its ID."""
         # Extract file name and type from the path
-        file_name = os.path.basename(file_path)
-        file_type = os.path.splitext(file_name)[1].lstrip('.')
+        source = PurePath(file_path)
+        file_name = source.name
+        file_type = source.suffix[1:]
         
         # Create a new attachment entity
         attachment = Attachment(
@@ -48,6 +59,10 @@ class AttachmentServiceImpl(AttachmentService):
         """Delete an attachment by its ID and return success status."""
         return self.attachment_repository.delete_attachment(attachment_id)
     
+    def delete_attachments_for_note(self, note_id: int) -> int:
+        """Delete all attachments of a note and return how many were removed."""
+        return self.attachment_repository.delete_attachments_for_note(note_id)
+    
     def get_attachment_path(self, attachment_id: int) -> Optional[str]:
         """Get the file system path for an attachment."""
         return self.attachment_repository.get_attachment_path(attachment_id)
@@ -55,18 +70,19 @@ class AttachmentServiceImpl(AttachmentService):
     def open_attachment(self, attachment_id: int) -> bool:
         """Open an attachment with the system's default application."""
         path = self.get_attachment_path(attachment_id)
-        if not path or not os.path.exists(path):
+        if not path:
+            return False
+        
+        # A single stat both checks existence and rules out directories
+        try:
+            file_stat = os.stat(path)
+        except OSError:
+            return False
+        if not stat.S_ISREG(file_stat.st_mode):
             return False
         
         try:
-            # Use the appropriate command based on the operating system
-            if os.name == 'nt':  # Windows
-                os.startfile(path)
-            elif os.name == 'posix':  # macOS and Linux
-                if 'darwin' in os.uname().sysname.lower():  # macOS
-                    subprocess.call(['open', path])
-                else:  # Linux
-                    subprocess.call(['xdg-open', path])
+            _open_file(path)
             return True
         except Exception:
             return False
\ No newline at end of file
@@ -2,46 +2,42 @@ from typing import List, Optional, Tuple
 
 from domain.entities.folder import Folder
 from domain.repositories.folder_repository import FolderRepository
-from application.interfaces.folder_service import FolderService
 
-class FolderServiceImpl(FolderService):
+class FolderServiceImpl:
     """Implementation of the folder service use cases."""
     
     def __init__(self, folder_repository: FolderRepository):
         self.folder_repository = folder_repository
+        self.get_folder_by_id = folder_repository.get_folder_by_id
     
     def get_all_folders(self) -> List[Folder]:
         """Get all folders."""
         return self.folder_repository.get_all_folders()
     
-    def get_folder_by_id(self, folder_id: int) -> Optional[Folder]:
-        """Get a folder by its ID."""
-        return self.folder_repository.get_folder_by_id(folder_id)
+    def get_folders_by_ids(self, folder_ids: List[int]) -> List[Folder]:
+        """Get the folders matching the given IDs, in the order of the IDs."""
+        return self.folder_repository.get_folders_by_ids(folder_ids)
     
     def get_folder_hierarchy(self) -> List[Tuple[Folder, int]]:
         """Get the folder hierarchy as a list of (folder, depth) tuples."""
-        folders = self.folder_repository.get_all_folders()
-        result = []
-        
-        # First, find all root folders (parent_id is None)
-        root_folders = [f for f in folders if f.parent_id is None]
-        
-        # Process each root folder and its children recursively
-        for root_folder in root_folders:
-            self._add_folder_with_depth(result, root_folder, 0, folders)
-        
-        return result
+        return [(folder, depth) for folder, depth, _ in self.folder_repository.get_folder_tree()]
     
-    def _add_folder_with_depth(self, result: List[Tuple[Folder, int]], folder: Folder, depth: int, all_folders: List[Folder]) -> None:
-        """Helper method to recursively build the folder hierarchy."""
-        result.append((folder, depth))
-        
-        # Find all children of this folder
-        children = [f for f in all_folders if f.parent_id == folder.id]
-        
-        # Process each child recursively
-        for child in children:
-            self._add_folder_with_depth(result, child, depth + 1, all_folders)
+    def get_hierarchy_with_counts(self) -> List[Tuple[Folder, int, int]]:
+        """Get the folder hierarchy as a list of (folder, depth, note_count) tuples."""
+        # Note counts change with every note edit, so this is read fresh in one query
+        return self.folder_repository.get_folder_tree()
+    
+    def get_descendants(self, folder_id: int) -> List[Folder]:
+        """Get all folders nested below a folder, at any depth."""
+        return self.folder_repository.get_descendants(folder_id)
+    
+    def get_folder_subtree(self, root_id: int) -> List[Folder]:
+        """Get a folder together with all folders nested below it."""
+        return self.folder_repository.get_folder_subtree(root_id)
+    
+    def get_ancestors(self, folder_id: int) -> List[Folder]:
+        """Get the folders above a folder, nearest parent first."""
+        return self.folder_repository.get_ancestors(folder_id)
     
     def create_folder(self, name: str, parent_id: Optional[int] = None) -> int:
         """Create a new folder and return its ID."""
@@ -50,6 +46,10 @@ class FolderServiceImpl(FolderService):
     
     def rename_folder(self, folder_id: int, new_name: str) -> bool:
         """Rename a folder and return success status."""
+        # The default folder keeps its name
+        if folder_id == self.folder_repository.get_default_folder_id():
+            return False
+        
         return self.folder_repository.rename_folder(folder_id, new_name)
     
     def delete_folder(self, folder_id: int) -> bool:
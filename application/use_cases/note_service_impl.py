@@ -3,21 +3,24 @@ from typing import List, Optional
 from domain.entities.note import Note
 from domain.repositories.note_repository import NoteRepository
 from domain.value_objects.search_criteria import SearchCriteria
-from application.interfaces.note_service import NoteService
 
-class NoteServiceImpl(NoteService):
+class NoteServiceImpl:
     """Implementation of the note service use cases."""
     
     def __init__(self, note_repository: NoteRepository):
         self.note_repository = note_repository
+        self.get_note_by_id = note_repository.get_note_by_id
     
-    def get_all_notes(self, folder_id: Optional[int] = None) -> List[Note]:
-        """Get all notes, optionally filtered by folder ID."""
-        return self.note_repository.get_all_notes(folder_id)
+    def get_all_notes(self, folder_id: Optional[int] = None,
+                      limit: Optional[int] = None, offset: int = 0) -> List[Note]:
+        """Get all notes, optionally filtered by folder ID and paginated."""
+        if limit is None and offset == 0:
+            return self.note_repository.get_all_notes(folder_id)
+        return self.note_repository.get_notes_page(folder_id, -1 if limit is None else limit, offset)
     
-    def get_note_by_id(self, note_id: int) -> Optional[Note]:
-        """Get a note by its ID."""
-        return self.note_repository.get_note_by_id(note_id)
+    def get_notes_by_ids(self, note_ids: List[int]) -> List[Note]:
+        """Get the notes matching the given IDs, in the order of the IDs."""
+        return self.note_repository.get_notes_by_ids(note_ids)
     
     def create_note(self, title: str, content: str, folder_id: Optional[int] = None) -> int:
         """Create a new note and return its ID."""
@@ -1,8 +1,8 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 
-@dataclass
+@dataclass(slots=True)
 class Attachment:
     """Entity representing a file attachment for a note."""
     id: Optional[int] = None
@@ -10,7 +10,7 @@ class Attachment:
     file_path: str = ""
     file_name: str = ""
     file_type: str = ""  # e.g., "pdf", "image", etc.
-    created_at: datetime = datetime.now()
+    created_at: datetime = field(default_factory=datetime.now)
     
     @property
     def is_pdf(self) -> bool:
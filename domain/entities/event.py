@@ -2,13 +2,14 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     """Entity representing a calendar event in the system."""
     id: Optional[int] = None
     title: str = ""
     description: str = ""
     date: datetime = field(default_factory=datetime.now)
+    version: int = 0  # Incremented on every stored update
     
     def update_title(self, new_title: str) -> None:
         """Update the event title."""
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import List, Optional
 
-@dataclass
+@dataclass(slots=True)
 class Folder:
     """Entity representing a folder in the hierarchical structure."""
     id: Optional[int] = None
@@ -18,10 +18,9 @@ class Folder:
         """Get the folder name from the path."""
         if not self.path:
             return self.name
-        return self.path.split("/")[-1]
+        # rpartition scans from the right once, without building a segment list
+        return self.path.rpartition("/")[2]
     
     def get_parent_path(self) -> str:
         """Get the parent path."""
-        if not self.path or "/" not in self.path:
-            return ""
-        return "/".join(self.path.split("/")[:-1])
\ No newline at end of file
+        return self.path.rpartition("/")[0]
\ No newline at end of file
@@ -2,7 +2,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List, Optional
 
-@dataclass
+@dataclass(slots=True)
 class Note:
     """Entity representing a note in the system."""
     id: Optional[int] = None
@@ -11,7 +11,9 @@ class Note:
     created_at: datetime = field(default_factory=datetime.now)
     modified_at: datetime = field(default_factory=datetime.now)
     folder_id: int = 1  # Default to 'Geral' folder
+    version: int = 0  # Incremented on every stored update
     attachment_ids: List[int] = field(default_factory=list)
+    folder_name: Optional[str] = None  # Only filled in on search results
     
     def update_content(self, new_content: str) -> None:
         """Update the note content and modification time."""
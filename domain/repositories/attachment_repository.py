@@ -21,11 +21,21 @@ class AttachmentRepository(ABC):
         """Add a new attachment and return its ID."""
         pass
     
+    @abstractmethod
+    def add_attachments_bulk(self, attachments: List[Attachment]) -> List[int]:
+        """Add several attachments in a single transaction and return their IDs in order."""
+        pass
+    
     @abstractmethod
     def delete_attachment(self, attachment_id: int) -> bool:
         """Delete an attachment by its ID and return success status."""
         pass
     
+    @abstractmethod
+    def delete_attachments_for_note(self, note_id: int) -> int:
+        """Delete all attachments of a note and return how many were removed."""
+        pass
+    
     @abstractmethod
     def get_attachment_path(self, attachment_id: int) -> Optional[str]:
         """Get the file system path for an attachment."""
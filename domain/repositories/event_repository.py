@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from datetime import date
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 from domain.entities.event import Event
 
@@ -12,6 +12,11 @@ class EventRepository(ABC):
         """Retrieve all events."""
         pass
     
+    @abstractmethod
+    def iter_events(self) -> Iterator[Event]:
+        """Lazily yield all events in date order."""
+        pass
+    
     @abstractmethod
     def get_event_by_id(self, event_id: int) -> Optional[Event]:
         """Retrieve an event by its ID."""
@@ -22,11 +27,26 @@ class EventRepository(ABC):
         """Retrieve all events for a specific date."""
         pass
     
+    @abstractmethod
+    def get_events_in_range(self, start_date: date, end_date: date) -> List[Event]:
+        """Retrieve all events between two dates, inclusive."""
+        pass
+    
+    @abstractmethod
+    def get_dates_with_events(self, start_date: date, end_date: date) -> List[date]:
+        """Retrieve the distinct dates between two dates that have events."""
+        pass
+    
     @abstractmethod
     def add_event(self, event: Event) -> int:
         """Add a new event and return its ID."""
         pass
     
+    @abstractmethod
+    def add_events_bulk(self, events: List[Event]) -> int:
+        """Add several events in a single transaction and return how many were inserted."""
+        pass
+    
     @abstractmethod
     def update_event(self, event: Event) -> bool:
         """Update an existing event and return success status."""
@@ -1,11 +1,16 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from domain.entities.folder import Folder
 
 class FolderRepository(ABC):
     """Interface for folder repository operations."""
     
+    @abstractmethod
+    def get_default_folder_id(self) -> Optional[int]:
+        """Get the ID of the default folder, which cannot be renamed, moved or deleted."""
+        pass
+    
     @abstractmethod
     def get_all_folders(self) -> List[Folder]:
         """Retrieve all folders."""
@@ -16,16 +21,41 @@ class FolderRepository(ABC):
         """Retrieve a folder by its ID."""
         pass
     
+    @abstractmethod
+    def get_folders_by_ids(self, folder_ids: List[int]) -> List[Folder]:
+        """Retrieve the folders matching the given IDs, in the order of the IDs."""
+        pass
+    
     @abstractmethod
     def get_subfolders(self, parent_id: Optional[int] = None) -> List[Folder]:
         """Retrieve all subfolders of a given parent folder."""
         pass
     
+    @abstractmethod
+    def get_descendants(self, folder_id: int) -> List[Folder]:
+        """Retrieve all folders nested below a given folder, at any depth."""
+        pass
+    
+    @abstractmethod
+    def get_folder_subtree(self, root_id: int) -> List[Folder]:
+        """Retrieve a folder together with all folders nested below it."""
+        pass
+    
+    @abstractmethod
+    def get_ancestors(self, folder_id: int) -> List[Folder]:
+        """Retrieve the folders above a given folder, nearest parent first."""
+        pass
+    
     @abstractmethod
     def create_folder(self, folder: Folder) -> int:
         """Create a new folder and return its ID."""
         pass
     
+    @abstractmethod
+    def create_folders_bulk(self, folders: List[Folder]) -> int:
+        """Create several folders in a single transaction and return how many were created."""
+        pass
+    
     @abstractmethod
     def rename_folder(self, folder_id: int, new_name: str) -> bool:
         """Rename a folder and return success status."""
@@ -44,4 +74,9 @@ class FolderRepository(ABC):
     @abstractmethod
     def get_folder_note_count(self, folder_id: int) -> int:
         """Get the number of notes in a folder."""
+        pass
+    
+    @abstractmethod
+    def get_folder_tree(self) -> List[Tuple[Folder, int, int]]:
+        """Retrieve all folders depth-first as (folder, depth, note_count) tuples."""
         pass
\ No newline at end of file
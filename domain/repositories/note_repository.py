@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 from domain.entities.note import Note
 
@@ -11,16 +11,36 @@ class NoteRepository(ABC):
         """Retrieve all notes, optionally filtered by folder ID."""
         pass
     
+    @abstractmethod
+    def get_notes_page(self, folder_id: Optional[int], limit: int, offset: int) -> List[Note]:
+        """Retrieve a page of notes, most recently modified first, optionally filtered by folder ID."""
+        pass
+    
+    @abstractmethod
+    def iter_notes(self, folder_id: Optional[int] = None, limit: int = -1, offset: int = 0) -> Iterator[Note]:
+        """Lazily yield notes, most recently modified first, optionally filtered by folder ID."""
+        pass
+    
     @abstractmethod
     def get_note_by_id(self, note_id: int) -> Optional[Note]:
         """Retrieve a note by its ID."""
         pass
     
+    @abstractmethod
+    def get_notes_by_ids(self, note_ids: List[int]) -> List[Note]:
+        """Retrieve the notes matching the given IDs, in the order of the IDs."""
+        pass
+    
     @abstractmethod
     def add_note(self, note: Note) -> int:
         """Add a new note and return its ID."""
         pass
     
+    @abstractmethod
+    def add_notes_bulk(self, notes: List[Note]) -> int:
+        """Add several notes in a single transaction and return how many were inserted."""
+        pass
+    
     @abstractmethod
     def update_note(self, note: Note) -> bool:
         """Update an existing note and return success status."""
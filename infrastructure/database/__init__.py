@@ -1,3 +1,4 @@
+from infrastructure.database.connection import DatabaseConnection
 from infrastructure.database.db_init import DatabaseInitializer
 from infrastructure.database.note_repository_impl import NoteRepositoryImpl
 from infrastructure.database.folder_repository_impl import FolderRepositoryImpl
@@ -5,6 +6,7 @@ from infrastructure.database.event_repository_impl import EventRepositoryImpl
 from infrastructure.database.attachment_repository_impl import AttachmentRepositoryImpl
 
 __all__ = [
+    'DatabaseConnection',
     'DatabaseInitializer',
     'NoteRepositoryImpl',
     'FolderRepositoryImpl',
@@ -1,9 +1,38 @@
 import os
-from datetime import datetime
+from itertools import starmap
 from typing import List, Optional
 
 from domain.entities.attachment import Attachment
 from domain.repositories.attachment_repository import AttachmentRepository
+from infrastructure.database.connection import MAX_IN_PARAMS
+
+SQL_GET_ATTACHMENTS_FOR_NOTE = (
+    'SELECT id, note_id, file_path, file_name, file_type, created_at AS "created_at [datetime]" FROM attachments '
+    "WHERE note_id = ? ORDER BY created_at DESC"
+)
+SQL_GET_ALL_ATTACHMENTS = (
+    'SELECT id, note_id, file_path, file_name, file_type, created_at AS "created_at [datetime]" FROM attachments '
+    "ORDER BY created_at DESC"
+)
+SQL_GET_ATTACHMENT_BY_ID = (
+    'SELECT id, note_id, file_path, file_name, file_type, created_at AS "created_at [datetime]" FROM attachments WHERE id = ?'
+)
+SQL_GET_ATTACHMENT_PATH = "SELECT file_path FROM attachments WHERE id = ?"
+
+def delete_note_attachment_rows(db, note_id: int) -> List[str]:
+    """Delete the attachment rows of a note, without committing, and return their file paths."""
+    cursor = db.execute("DELETE FROM attachments WHERE note_id = ? RETURNING file_path", (note_id,))
+    return [row[0] for row in cursor.fetchall()]
+
+def remove_attachment_files(file_paths: List[str]) -> None:
+    """Remove attachment files once their rows are committed, so no file is orphaned on disk."""
+    for file_path in file_paths:
+        # A missing file fails the same way as an unremovable one, so no
+        # separate existence check is needed; the rows are gone either way
+        try:
+            os.remove(file_path)
+        except OSError:
+            pass
 
 class AttachmentRepositoryImpl(AttachmentRepository):
     """SQLite implementation of the attachment repository."""
@@ -15,57 +44,30 @@ class AttachmentRepositoryImpl(AttachmentRepository):
         """Retrieve all attachments for a specific note."""
         cursor = self.db.cursor()
         
+        # Two fixed statements, each with its own cached plan; folding them
+        # into "? IS NULL OR note_id = ?" would turn the per-note lookup on
+        # idx_attachments_note_created into a full scan plus a sort
         if note_id is None:
             # Get all attachments if note_id is None
-            cursor.execute(
-                "SELECT id, note_id, file_path, file_name, file_type, created_at FROM attachments ORDER BY created_at DESC"
-            )
+            cursor.execute(SQL_GET_ALL_ATTACHMENTS)
         else:
-            cursor.execute(
-                "SELECT id, note_id, file_path, file_name, file_type, created_at FROM attachments WHERE note_id = ? ORDER BY created_at DESC",
-                (note_id,)
-            )
-        
-        attachments = []
-        for row in cursor.fetchall():
-            attachment = Attachment(
-                id=row[0],
-                note_id=row[1],
-                file_path=row[2],
-                file_name=row[3],
-                file_type=row[4],
-                created_at=datetime.fromisoformat(row[5])
-            )
-            attachments.append(attachment)
+            cursor.execute(SQL_GET_ATTACHMENTS_FOR_NOTE, (note_id,))
         
-        return attachments
+        return list(starmap(Attachment, cursor))
     
     def get_attachment_by_id(self, attachment_id: int) -> Optional[Attachment]:
         """Retrieve an attachment by its ID."""
-        cursor = self.db.cursor()
-        cursor.execute(
-            "SELECT id, note_id, file_path, file_name, file_type, created_at FROM attachments WHERE id = ?",
-            (attachment_id,)
-        )
-        
-        row = cursor.fetchone()
+        row = self.db.execute(SQL_GET_ATTACHMENT_BY_ID, (attachment_id,)).fetchone()
         if row is None:
             return None
         
-        return Attachment(
-            id=row[0],
-            note_id=row[1],
-            file_path=row[2],
-            file_name=row[3],
-            file_type=row[4],
-            created_at=datetime.fromisoformat(row[5])
-        )
+        return Attachment(*row)
     
     def add_attachment(self, attachment: Attachment) -> int:
         """Add a new attachment and return its ID."""
         cursor = self.db.cursor()
         cursor.execute(
-            "INSERT INTO attachments (note_id, file_path, file_name, file_type, created_at) VALUES (?, ?, ?, ?, ?)",
+            "INSERT INTO attachments (note_id, file_path, file_name, file_type, created_at) VALUES (?, ?, ?, ?, ?) RETURNING id",
             (
                 attachment.note_id,
                 attachment.file_path,
@@ -74,42 +76,70 @@ class AttachmentRepositoryImpl(AttachmentRepository):
                 attachment.created_at.isoformat()
             )
         )
+        attachment_id = cursor.fetchone()[0]
         
         self.db.commit()
-        return cursor.lastrowid
+        return attachment_id
+    
+    def add_attachments_bulk(self, attachments: List[Attachment]) -> List[int]:
+        """Add several attachments in a single transaction and return their IDs in order."""
+        cursor = self.db.cursor()
+        attachment_ids = []
+        
+        # executemany() drops the rows of a RETURNING clause, so insert each
+        # chunk as one multi-row statement instead; all full chunks share the
+        # same SQL text and therefore the same cached prepared statement
+        rows_per_chunk = MAX_IN_PARAMS // 5
+        for start in range(0, len(attachments), rows_per_chunk):
+            chunk = attachments[start:start + rows_per_chunk]
+            values = ", ".join(["(?, ?, ?, ?, ?)" for _ in chunk])
+            params = []
+            for attachment in chunk:
+                params.extend((
+                    attachment.note_id,
+                    attachment.file_path,
+                    attachment.file_name,
+                    attachment.file_type,
+                    attachment.created_at.isoformat()
+                ))
+            
+            cursor.execute(
+                f"INSERT INTO attachments (note_id, file_path, file_name, file_type, created_at) VALUES {values} RETURNING id",
+                params
+            )
+            # RETURNING does not guarantee row order, but AUTOINCREMENT ids
+            # grow with insertion order
+            attachment_ids.extend(sorted(row[0] for row in cursor.fetchall()))
+        
+        # One commit for all chunks
+        self.db.commit()
+        return attachment_ids
     
     def delete_attachment(self, attachment_id: int) -> bool:
         """Delete an attachment by its ID and return success status."""
         cursor = self.db.cursor()
         
-        # Get the file path to delete the physical file
-        cursor.execute("SELECT file_path FROM attachments WHERE id = ?", (attachment_id,))
+        # Drop the record and get the path of its physical file in one statement
+        cursor.execute("DELETE FROM attachments WHERE id = ? RETURNING file_path", (attachment_id,))
         row = cursor.fetchone()
+        self.db.commit()
         if row is None:
             return False
         
-        file_path = row[0]
-        
-        # Delete the attachment record
-        cursor.execute("DELETE FROM attachments WHERE id = ?", (attachment_id,))
-        
-        # Delete the physical file if it exists
-        if os.path.exists(file_path):
-            try:
-                os.remove(file_path)
-            except OSError:
-                # Log the error but continue with the database deletion
-                pass
-        
+        remove_attachment_files([row[0]])
+        return True
+    
+    def delete_attachments_for_note(self, note_id: int) -> int:
+        """Delete all attachments of a note and return how many were removed."""
+        file_paths = delete_note_attachment_rows(self.db, note_id)
         self.db.commit()
-        return cursor.rowcount > 0
+        
+        remove_attachment_files(file_paths)
+        return len(file_paths)
     
     def get_attachment_path(self, attachment_id: int) -> Optional[str]:
         """Get the file system path for an attachment."""
-        cursor = self.db.cursor()
-        cursor.execute("SELECT file_path FROM attachments WHERE id = ?", (attachment_id,))
-        
-        row = cursor.fetchone()
+        row = self.db.execute(SQL_GET_ATTACHMENT_PATH, (attachment_id,)).fetchone()
         if row is None:
             return None
         
@@ -0,0 +1,74 @@
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime
+
+# Columns selected as '<name> AS "<name> [datetime]"' are parsed from their
+# stored ISO text by the driver as rows are fetched
+sqlite3.register_converter("datetime", lambda value: datetime.fromisoformat(value.decode()))
+
+# Keep IN (...) lists well below SQLite's bound-parameter limit
+MAX_IN_PARAMS = 500
+
+class DatabaseConnection(sqlite3.Connection):
+    """SQLite connection that can group several repository writes into one transaction."""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._batch_depth = 0
+        # Set by DatabaseInitializer; the default folder is never deleted, so
+        # its id can be resolved once per connection
+        self.general_folder_id = None
+    
+    @contextmanager
+    def batch(self):
+        """Defer repository commits until the outermost batch exits.
+        
+        Everything written inside the block is committed together with a
+        single fsync, or rolled back together if the block raises. The
+        outermost batch takes the write lock up front (BEGIN IMMEDIATE), so
+        it cannot fail halfway through on a busy database.
+        
+        Yields:
+            The connection itself
+        """
+        if self._batch_depth == 0 and not self.in_transaction:
+            self.execute("BEGIN IMMEDIATE")
+        self._batch_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.rollback()
+            raise
+        
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            self.commit()
+    
+    @contextmanager
+    def savepoint(self):
+        """Make the writes in the block one unit that is undone on its own if it raises.
+        
+        Unlike rollback(), a failure only discards what the block wrote, so
+        the earlier and later writes of an enclosing batch are kept. Outside
+        a transaction the savepoint opens one, and releasing it commits.
+        
+        Yields:
+            The connection itself
+        """
+        self.execute("SAVEPOINT unit")
+        try:
+            yield self
+        except BaseException:
+            self.execute("ROLLBACK TO unit")
+            self.execute("RELEASE unit")
+            raise
+        
+        self.execute("RELEASE unit")
+    
+    def commit(self):
+        """Commit the current transaction, unless a batch is open."""
+        if self._batch_depth:
+            return
+        super().commit()
\ No newline at end of file
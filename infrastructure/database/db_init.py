@@ -2,6 +2,107 @@ import os
 import sqlite3
 from datetime import datetime
 
+from infrastructure.database.connection import DatabaseConnection
+from shared.constants.app_constants import DEFAULT_FOLDER_NAME
+
+# Schema, created statement by statement when the database is opened
+SCHEMA_DDL = """
+CREATE TABLE IF NOT EXISTS folders (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    parent_id INTEGER,
+    path TEXT NOT NULL,
+    note_count INTEGER NOT NULL DEFAULT 0,
+    FOREIGN KEY (parent_id) REFERENCES folders(id) ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS notes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    title TEXT NOT NULL,
+    content TEXT,
+    created_at TEXT NOT NULL,
+    modified_at TEXT NOT NULL,
+    folder_id INTEGER NOT NULL,
+    version INTEGER NOT NULL DEFAULT 0,
+    FOREIGN KEY (folder_id) REFERENCES folders(id) ON DELETE CASCADE
+);
+
+-- Keep each folder's note count up to date as notes come, go and move
+CREATE TRIGGER IF NOT EXISTS notes_count_insert AFTER INSERT ON notes BEGIN
+    UPDATE folders SET note_count = note_count + 1 WHERE id = new.folder_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS notes_count_delete AFTER DELETE ON notes BEGIN
+    UPDATE folders SET note_count = note_count - 1 WHERE id = old.folder_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS notes_count_move AFTER UPDATE OF folder_id ON notes
+WHEN old.folder_id IS NOT new.folder_id BEGIN
+    UPDATE folders SET note_count = note_count - 1 WHERE id = old.folder_id;
+    UPDATE folders SET note_count = note_count + 1 WHERE id = new.folder_id;
+END;
+
+CREATE TABLE IF NOT EXISTS attachments (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    note_id INTEGER NOT NULL,
+    file_path TEXT NOT NULL,
+    file_name TEXT NOT NULL,
+    file_type TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    FOREIGN KEY (note_id) REFERENCES notes(id) ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    title TEXT NOT NULL,
+    description TEXT,
+    date TEXT NOT NULL,
+    version INTEGER NOT NULL DEFAULT 0
+);
+
+-- Full-text index over note titles and contents; it stores no copy of the
+-- text and is kept in sync with notes by triggers. Indexing trigrams lets it
+-- answer substring searches, not just whole words (requires SQLite 3.34)
+CREATE VIRTUAL TABLE IF NOT EXISTS notes_fts USING fts5(
+    title,
+    content,
+    content='notes',
+    content_rowid='id',
+    tokenize='trigram'
+);
+
+CREATE TRIGGER IF NOT EXISTS notes_fts_insert AFTER INSERT ON notes BEGIN
+    INSERT INTO notes_fts (rowid, title, content) VALUES (new.id, new.title, new.content);
+END;
+
+CREATE TRIGGER IF NOT EXISTS notes_fts_delete AFTER DELETE ON notes BEGIN
+    INSERT INTO notes_fts (notes_fts, rowid, title, content) VALUES ('delete', old.id, old.title, old.content);
+END;
+
+CREATE TRIGGER IF NOT EXISTS notes_fts_update AFTER UPDATE OF title, content ON notes BEGIN
+    INSERT INTO notes_fts (notes_fts, rowid, title, content) VALUES ('delete', old.id, old.title, old.content);
+    INSERT INTO notes_fts (rowid, title, content) VALUES (new.id, new.title, new.content);
+END;
+
+-- Folder paths make subtree lookups prefix range scans; (parent, name) serves
+-- child listings already in name order and the ON DELETE CASCADE from a parent
+-- folder. It supersedes the plain parent index of older databases
+CREATE INDEX IF NOT EXISTS idx_folders_path ON folders(path);
+DROP INDEX IF EXISTS idx_folders_parent;
+CREATE INDEX IF NOT EXISTS idx_folders_children ON folders(parent_id, name);
+
+-- Notes and attachments are indexed in the order they are listed, so
+-- listings are read straight from the index instead of being sorted
+CREATE INDEX IF NOT EXISTS idx_notes_modified ON notes(modified_at DESC);
+CREATE INDEX IF NOT EXISTS idx_notes_folder_modified ON notes(folder_id, modified_at DESC);
+CREATE INDEX IF NOT EXISTS idx_attachments_note_created ON attachments(note_id, created_at DESC);
+
+-- Event dates, so calendar range queries, including a single day's, avoid
+-- full scans. The day-part index of older databases is no longer used
+CREATE INDEX IF NOT EXISTS idx_events_date ON events(date);
+DROP INDEX IF EXISTS idx_events_datepart;
+"""
+
 class DatabaseInitializer:
     """Class responsible for initializing the SQLite database."""
     
@@ -12,20 +113,55 @@ class DatabaseInitializer:
     
     def initialize_database(self):
         """Create the database and tables if they don't exist."""
+        in_memory = self.db_path == ":memory:"
+        
         # Ensure the directory exists
-        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        directory = os.path.dirname(self.db_path)
+        if directory and not in_memory:
+            os.makedirs(directory, exist_ok=True)
         
-        # Connect to the database (creates it if it doesn't exist)
-        self.connection = sqlite3.connect(self.db_path)
+        # Connect to the database (creates it if it doesn't exist); the larger
+        # statement cache keeps every repository query prepared across calls,
+        # and the connection class lets callers batch writes into one commit.
+        # The cache is keyed on the SQL text, which is why the repositories
+        # keep their hot queries in shared module-level SQL_* strings
+        self.connection = sqlite3.connect(
+            self.db_path,
+            cached_statements=256,
+            detect_types=sqlite3.PARSE_COLNAMES,
+            factory=DatabaseConnection
+        )
+        
+        if not in_memory:
+            # Use write-ahead logging: commits need a single fsync and reads
+            # no longer block on writes
+            self.connection.execute("PRAGMA journal_mode = WAL")
+            self.connection.execute("PRAGMA synchronous = NORMAL")
+            
+            # Read through a memory map
+            self.connection.execute("PRAGMA mmap_size = 268435456")
+        
+        # Keep temporary structures in memory and use a 20 MB page cache
+        self.connection.execute("PRAGMA temp_store = MEMORY")
+        self.connection.execute("PRAGMA cache_size = -20000")
         
         # Enable foreign keys
         self.connection.execute("PRAGMA foreign_keys = ON")
         
-        # Create tables
-        self._create_tables()
+        # Set up the schema and default data in a single transaction, so
+        # opening the database costs one commit; nothing is kept on failure
+        with self.connection.batch():
+            # Create tables
+            self._create_tables()
+            
+            # Upgrade databases created by older versions
+            self._migrate_schema()
+            
+            # Initialize with default data if needed
+            self._initialize_default_data()
         
-        # Initialize with default data if needed
-        self._initialize_default_data()
+        # Resolve the default folder once for every repository on this connection
+        self.connection.general_folder_id = self._get_general_folder_id()
         
         return self.connection
     
@@ -33,70 +169,79 @@ class DatabaseInitializer:
         """Create all required tables."""
         cursor = self.connection.cursor()
         
-        # Create folders table
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS folders (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL,
-            parent_id INTEGER,
-            path TEXT NOT NULL,
-            FOREIGN KEY (parent_id) REFERENCES folders(id) ON DELETE CASCADE
-        )
-        """)
-        
-        # Create notes table
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS notes (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            title TEXT NOT NULL,
-            content TEXT,
-            created_at TEXT NOT NULL,
-            modified_at TEXT NOT NULL,
-            folder_id INTEGER NOT NULL,
-            FOREIGN KEY (folder_id) REFERENCES folders(id) ON DELETE CASCADE
-        )
-        """)
-        
-        # Create attachments table
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS attachments (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            note_id INTEGER NOT NULL,
-            file_path TEXT NOT NULL,
-            file_name TEXT NOT NULL,
-            file_type TEXT NOT NULL,
-            created_at TEXT NOT NULL,
-            FOREIGN KEY (note_id) REFERENCES notes(id) ON DELETE CASCADE
-        )
-        """)
-        
-        # Create events table
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS events (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            title TEXT NOT NULL,
-            description TEXT,
-            date TEXT NOT NULL
-        )
-        """)
+        # The full-text index needs a one-off rebuild if it is new
+        cursor.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'notes_fts'")
+        row = cursor.fetchone()
+        fts_exists = row is not None
+        
+        if fts_exists and "trigram" not in row[0]:
+            # Older versions indexed whole words, which cannot serve substring
+            # searches; drop that index so it is recreated and rebuilt below
+            cursor.execute("DROP TABLE notes_fts")
+            fts_exists = False
+        
+        # Run the DDL one statement at a time inside the initialization
+        # transaction; executescript() would commit it first and give up the
+        # write lock taken when it began. complete_statement() keeps the
+        # trigger bodies, which contain semicolons, in one piece
+        statement = ""
+        for line in SCHEMA_DDL.splitlines(keepends=True):
+            statement += line
+            if sqlite3.complete_statement(statement):
+                cursor.execute(statement)
+                statement = ""
         
-        self.connection.commit()
+        if not fts_exists:
+            # Index the notes written before the full-text table existed
+            cursor.execute("INSERT INTO notes_fts (notes_fts) VALUES ('rebuild')")
+        
+        # Keep sibling folder names unique; top-level folders have no parent,
+        # and NULLs never collide in a UNIQUE index, so they are keyed as 0
+        try:
+            cursor.execute(
+                "CREATE UNIQUE INDEX IF NOT EXISTS idx_folders_parent_name ON folders(COALESCE(parent_id, 0), name)"
+            )
+        except sqlite3.IntegrityError:
+            # A database that already holds duplicate siblings keeps working without it
+            pass
+    
+    def _migrate_schema(self):
+        """Add the columns introduced after a database was first created."""
+        cursor = self.connection.cursor()
+        
+        for table in ("notes", "events"):
+            cursor.execute(f"PRAGMA table_info({table})")
+            columns = {row[1] for row in cursor.fetchall()}
+            
+            if "version" not in columns:
+                # A constant DEFAULT is stored in the schema, so no row is rewritten
+                cursor.execute(f"ALTER TABLE {table} ADD COLUMN version INTEGER NOT NULL DEFAULT 0")
+        
+        cursor.execute("PRAGMA table_info(folders)")
+        if "note_count" not in {row[1] for row in cursor.fetchall()}:
+            # Count the existing notes once; the triggers keep it current from here on
+            cursor.execute("ALTER TABLE folders ADD COLUMN note_count INTEGER NOT NULL DEFAULT 0")
+            cursor.execute(
+                "UPDATE folders SET note_count = (SELECT COUNT(*) FROM notes WHERE folder_id = folders.id)"
+            )
     
     def _initialize_default_data(self):
         """Initialize the database with default data if it's empty."""
         cursor = self.connection.cursor()
         
-        # Check if the folders table is empty
-        cursor.execute("SELECT COUNT(*) FROM folders")
-        folder_count = cursor.fetchone()[0]
+        # Check if the folders table is empty; EXISTS stops at the first row
+        # where COUNT(*) would visit them all
+        cursor.execute("SELECT EXISTS (SELECT 1 FROM folders)")
+        has_folders = cursor.fetchone()[0]
         
-        if folder_count == 0:
+        if not has_folders:
             # Create the default 'Geral' (General) folder
             now = datetime.now().isoformat()
             cursor.execute(
-                "INSERT INTO folders (name, parent_id, path) VALUES (?, ?, ?)",
-                ("Geral", None, "/Geral")
+                "INSERT INTO folders (name, parent_id, path) VALUES (?, ?, ?) RETURNING id",
+                (DEFAULT_FOLDER_NAME, None, f"/{DEFAULT_FOLDER_NAME}")
             )
+            general_folder_id = cursor.fetchone()[0]
             
             # Create a welcome note in the General folder
             cursor.execute(
@@ -106,8 +251,17 @@ class DatabaseInitializer:
                     "Bem-vindo ao seu novo aplicativo de notas! Este é um exemplo de nota.",
                     now,
                     now,
-                    1  # ID of the General folder
+                    general_folder_id
                 )
             )
-            
-            self.connection.commit()
\ No newline at end of file
+    
+    def _get_general_folder_id(self):
+        """Return the ID of the default top-level folder."""
+        cursor = self.connection.cursor()
+        
+        # The default folder is created first and can never be moved or
+        # deleted, so it is always the oldest top-level folder; its name is
+        # not used, since another top-level folder could take it
+        cursor.execute("SELECT MIN(id) FROM folders WHERE parent_id IS NULL")
+        
+        return cursor.fetchone()[0]
\ No newline at end of file
@@ -1,9 +1,16 @@
-from datetime import date, datetime
-from typing import List, Optional
+from datetime import date, timedelta
+from itertools import starmap
+from typing import Iterator, List, Optional
 
 from domain.entities.event import Event
 from domain.repositories.event_repository import EventRepository
 
+SQL_GET_EVENT_BY_ID = 'SELECT id, title, description, date AS "date [datetime]", version FROM events WHERE id = ?'
+SQL_GET_ALL_EVENTS = 'SELECT id, title, description, date AS "date [datetime]", version FROM events ORDER BY date'
+SQL_GET_EVENTS_IN_RANGE = (
+    'SELECT id, title, description, date AS "date [datetime]", version FROM events WHERE date >= ? AND date < ? ORDER BY date'
+)
+
 class EventRepositoryImpl(EventRepository):
     """SQLite implementation of the event repository."""
     
@@ -12,75 +19,85 @@ class EventRepositoryImpl(EventRepository):
     
     def get_all_events(self) -> List[Event]:
         """Retrieve all events."""
+        return list(self.iter_events())
+    
+    def iter_events(self) -> Iterator[Event]:
+        """Lazily yield all events in date order."""
         cursor = self.db.cursor()
-        cursor.execute("SELECT id, title, description, date FROM events ORDER BY date")
+        cursor.execute(SQL_GET_ALL_EVENTS)
         
-        events = []
-        for row in cursor.fetchall():
-            event = Event(
-                id=row[0],
-                title=row[1],
-                description=row[2],
-                date=datetime.fromisoformat(row[3])
-            )
-            events.append(event)
-        
-        return events
+        # Pull rows from SQLite in batches, so only one batch is held in
+        # memory and a caller that stops early never reads the rest
+        cursor.arraysize = 1024
+        while rows := cursor.fetchmany():
+            yield from starmap(Event, rows)
     
     def get_event_by_id(self, event_id: int) -> Optional[Event]:
         """Retrieve an event by its ID."""
-        cursor = self.db.cursor()
-        cursor.execute(
-            "SELECT id, title, description, date FROM events WHERE id = ?",
-            (event_id,)
-        )
-        
-        row = cursor.fetchone()
+        row = self.db.execute(SQL_GET_EVENT_BY_ID, (event_id,)).fetchone()
         if row is None:
             return None
         
-        return Event(
-            id=row[0],
-            title=row[1],
-            description=row[2],
-            date=datetime.fromisoformat(row[3])
-        )
+        return Event(*row)
     
     def get_events_by_date(self, event_date: date) -> List[Event]:
         """Retrieve all events for a specific date."""
         cursor = self.db.cursor()
         
-        # Convert date to string in ISO format (YYYY-MM-DD)
-        date_str = event_date.isoformat()
+        # Match the day as a half-open range over the raw ISO strings, which
+        # idx_events_date answers already in date order
+        cursor.execute(
+            SQL_GET_EVENTS_IN_RANGE,
+            (event_date.isoformat(), (event_date + timedelta(days=1)).isoformat())
+        )
         
-        # Use date() function in SQLite to extract the date part from the datetime string
+        return list(starmap(Event, cursor))
+    
+    def get_events_in_range(self, start_date: date, end_date: date) -> List[Event]:
+        """Retrieve all events between two dates, inclusive."""
+        cursor = self.db.cursor()
+        
+        # Dates are stored as ISO strings, so a half-open string range over
+        # the raw column can be answered from idx_events_date
         cursor.execute(
-            "SELECT id, title, description, date FROM events WHERE date(date) = ? ORDER BY date",
-            (date_str,)
+            SQL_GET_EVENTS_IN_RANGE,
+            (start_date.isoformat(), (end_date + timedelta(days=1)).isoformat())
         )
         
-        events = []
-        for row in cursor.fetchall():
-            event = Event(
-                id=row[0],
-                title=row[1],
-                description=row[2],
-                date=datetime.fromisoformat(row[3])
-            )
-            events.append(event)
+        return list(starmap(Event, cursor))
+    
+    def get_dates_with_events(self, start_date: date, end_date: date) -> List[date]:
+        """Retrieve the distinct dates between two dates that have events."""
+        cursor = self.db.cursor()
+        cursor.execute(
+            "SELECT DISTINCT date(date) FROM events WHERE date >= ? AND date < ? ORDER BY 1",
+            (start_date.isoformat(), (end_date + timedelta(days=1)).isoformat())
+        )
         
-        return events
+        return [date.fromisoformat(row[0]) for row in cursor.fetchall()]
     
     def add_event(self, event: Event) -> int:
         """Add a new event and return its ID."""
         cursor = self.db.cursor()
         cursor.execute(
-            "INSERT INTO events (title, description, date) VALUES (?, ?, ?)",
+            "INSERT INTO events (title, description, date) VALUES (?, ?, ?) RETURNING id",
             (event.title, event.description, event.date.isoformat())
         )
+        event_id = cursor.fetchone()[0]
         
         self.db.commit()
-        return cursor.lastrowid
+        return event_id
+    
+    def add_events_bulk(self, events: List[Event]) -> int:
+        """Add several events in a single transaction and return how many were inserted."""
+        cursor = self.db.cursor()
+        cursor.executemany(
+            "INSERT INTO events (title, description, date) VALUES (?, ?, ?)",
+            [(event.title, event.description, event.date.isoformat()) for event in events]
+        )
+        
+        self.db.commit()
+        return cursor.rowcount
     
     def update_event(self, event: Event) -> bool:
         """Update an existing event and return success status."""
@@ -88,13 +105,19 @@ class EventRepositoryImpl(EventRepository):
             return False
         
         cursor = self.db.cursor()
+        
+        # Only write over the version that was read (optimistic concurrency)
         cursor.execute(
-            "UPDATE events SET title = ?, description = ?, date = ? WHERE id = ?",
-            (event.title, event.description, event.date.isoformat(), event.id)
+            "UPDATE events SET title = ?, description = ?, date = ?, version = version + 1 WHERE id = ? AND version = ?",
+            (event.title, event.description, event.date.isoformat(), event.id, event.version)
         )
         
         self.db.commit()
-        return cursor.rowcount > 0
+        if cursor.rowcount == 0:
+            return False
+        
+        event.version += 1
+        return True
     
     def delete_event(self, event_id: int) -> bool:
         """Delete an event by its ID and return success status."""
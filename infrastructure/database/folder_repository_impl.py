@@ -1,49 +1,63 @@
-from typing import List, Optional
+from itertools import starmap
+from typing import List, Optional, Tuple
 
 from domain.entities.folder import Folder
 from domain.repositories.folder_repository import FolderRepository
+from infrastructure.database.connection import MAX_IN_PARAMS
+
+SQL_GET_FOLDER_BY_ID = "SELECT id, name, parent_id, path FROM folders WHERE id = ?"
+SQL_GET_FOLDER_NOTE_COUNT = "SELECT note_count FROM folders WHERE id = ?"
+
+# Swap the "<old path>" prefix of all descendants for the new path; the
+# ["<old path>/", "<old path>0") range matches exactly the descendants
+SQL_REWRITE_SUBFOLDER_PATHS = (
+    "UPDATE folders SET path = ? || substr(path, ?) WHERE path >= ? AND path < ?"
+)
 
 class FolderRepositoryImpl(FolderRepository):
     """SQLite implementation of the folder repository."""
     
     def __init__(self, db_connection):
         self.db = db_connection
+        self.general_folder_id = db_connection.general_folder_id
+    
+    def get_default_folder_id(self) -> Optional[int]:
+        """Get the ID of the default folder, which cannot be renamed, moved or deleted."""
+        return self.general_folder_id
     
     def get_all_folders(self) -> List[Folder]:
         """Retrieve all folders."""
-        cursor = self.db.cursor()
-        cursor.execute("SELECT id, name, parent_id, path FROM folders ORDER BY path")
-        
-        folders = []
-        for row in cursor.fetchall():
-            folder = Folder(
-                id=row[0],
-                name=row[1],
-                parent_id=row[2],
-                path=row[3]
-            )
-            folders.append(folder)
+        cursor = self.db.execute("SELECT id, name, parent_id, path FROM folders ORDER BY path")
         
-        return folders
+        return list(starmap(Folder, cursor))
     
     def get_folder_by_id(self, folder_id: int) -> Optional[Folder]:
         """Retrieve a folder by its ID."""
-        cursor = self.db.cursor()
-        cursor.execute(
-            "SELECT id, name, parent_id, path FROM folders WHERE id = ?",
-            (folder_id,)
-        )
-        
-        row = cursor.fetchone()
+        row = self.db.execute(SQL_GET_FOLDER_BY_ID, (folder_id,)).fetchone()
         if row is None:
             return None
         
-        return Folder(
-            id=row[0],
-            name=row[1],
-            parent_id=row[2],
-            path=row[3]
-        )
+        return Folder(*row)
+    
+    def get_folders_by_ids(self, folder_ids: List[int]) -> List[Folder]:
+        """Retrieve the folders matching the given IDs, in the order of the IDs."""
+        folders = []
+        
+        for start in range(0, len(folder_ids), MAX_IN_PARAMS):
+            chunk = folder_ids[start:start + MAX_IN_PARAMS]
+            placeholders = ", ".join(["?" for _ in chunk])
+            
+            cursor = self.db.execute(
+                f"SELECT id, name, parent_id, path FROM folders WHERE id IN ({placeholders})",
+                chunk
+            )
+            
+            folders.extend(starmap(Folder, cursor))
+        
+        # Each chunk comes back in table order
+        position = {folder_id: index for index, folder_id in enumerate(folder_ids)}
+        folders.sort(key=lambda folder: position[folder.id])
+        return folders
     
     def get_subfolders(self, parent_id: Optional[int] = None) -> List[Folder]:
         """Retrieve all subfolders of a given parent folder."""
@@ -59,248 +73,242 @@ class FolderRepositoryImpl(FolderRepository):
                 (parent_id,)
             )
         
-        folders = []
-        for row in cursor.fetchall():
-            folder = Folder(
-                id=row[0],
-                name=row[1],
-                parent_id=row[2],
-                path=row[3]
-            )
-            folders.append(folder)
+        return list(starmap(Folder, cursor))
+    
+    def get_descendants(self, folder_id: int) -> List[Folder]:
+        """Retrieve all folders nested below a given folder, at any depth."""
+        # Descendant paths all start with "<path>/"; since '0' is the character
+        # right after '/', the prefix is the half-open range ["<path>/", "<path>0")
+        # which idx_folders_path answers directly, unlike LIKE
+        cursor = self.db.execute(
+            """SELECT id, name, parent_id, path FROM folders
+               WHERE path >= (SELECT path || '/' FROM folders WHERE id = ?)
+                 AND path < (SELECT path || '0' FROM folders WHERE id = ?)
+               ORDER BY path""",
+            (folder_id, folder_id)
+        )
         
-        return folders
+        return list(starmap(Folder, cursor))
+    
+    def get_folder_subtree(self, root_id: int) -> List[Folder]:
+        """Retrieve a folder together with all folders nested below it."""
+        # Walk down the parent links in one query; each level is an
+        # idx_folders_children lookup
+        cursor = self.db.execute(
+            """WITH RECURSIVE sub (id, name, parent_id, path) AS (
+                   SELECT id, name, parent_id, path FROM folders WHERE id = ?
+                   UNION ALL
+                   SELECT f.id, f.name, f.parent_id, f.path FROM folders f JOIN sub ON f.parent_id = sub.id
+               )
+               SELECT id, name, parent_id, path FROM sub""",
+            (root_id,)
+        )
+        
+        return list(starmap(Folder, cursor))
+    
+    def get_ancestors(self, folder_id: int) -> List[Folder]:
+        """Retrieve the folders above a given folder, nearest parent first."""
+        # Climb the parent links by primary key in one query
+        cursor = self.db.execute(
+            """WITH RECURSIVE up (id, name, parent_id, path, depth) AS (
+                   SELECT p.id, p.name, p.parent_id, p.path, 1
+                   FROM folders f JOIN folders p ON p.id = f.parent_id WHERE f.id = ?
+                   UNION ALL
+                   SELECT p.id, p.name, p.parent_id, p.path, up.depth + 1
+                   FROM folders p JOIN up ON p.id = up.parent_id
+               )
+               SELECT id, name, parent_id, path FROM up ORDER BY depth""",
+            (folder_id,)
+        )
+        
+        return list(starmap(Folder, cursor))
     
     def create_folder(self, folder: Folder) -> int:
         """Create a new folder and return its ID."""
-        cursor = self.db.cursor()
-        
-        # Check if a folder with the same name already exists at the same level
-        if folder.parent_id is None:
-            cursor.execute(
-                "SELECT COUNT(*) FROM folders WHERE name = ? AND parent_id IS NULL",
-                (folder.name,)
-            )
-        else:
-            cursor.execute(
-                "SELECT COUNT(*) FROM folders WHERE name = ? AND parent_id = ?",
-                (folder.name, folder.parent_id)
-            )
+        # Insert the new folder, deriving its path from the parent's in the same
+        # statement; the unique (parent, name) index turns a duplicate name
+        # into a skipped row, which returns no id
+        cursor = self.db.execute(
+            """INSERT INTO folders (name, parent_id, path)
+               VALUES (?, ?, COALESCE((SELECT path FROM folders WHERE id = ?) || '/', '') || ?)
+               ON CONFLICT DO NOTHING
+               RETURNING id""",
+            (folder.name, folder.parent_id, folder.parent_id, folder.name)
+        )
+        row = cursor.fetchone()
         
-        if cursor.fetchone()[0] > 0:
+        self.db.commit()
+        if row is None:
             raise ValueError(f"A folder named '{folder.name}' already exists at this level")
         
-        # Calculate the full path for the new folder
-        path = folder.name
-        if folder.parent_id is not None:
-            cursor.execute("SELECT path FROM folders WHERE id = ?", (folder.parent_id,))
-            parent_path = cursor.fetchone()[0]
-            path = f"{parent_path}/{folder.name}"
-        
-        # Insert the new folder
-        cursor.execute(
-            "INSERT INTO folders (name, parent_id, path) VALUES (?, ?, ?)",
-            (folder.name, folder.parent_id, path)
+        return row[0]
+    
+    def create_folders_bulk(self, folders: List[Folder]) -> int:
+        """Create several folders in a single transaction and return how many were created."""
+        # Same statement as create_folder, run once per folder and committed
+        # once; each path is resolved as its row is inserted, so a parent may
+        # come earlier in the same list, and duplicate names are skipped
+        cursor = self.db.executemany(
+            """INSERT INTO folders (name, parent_id, path)
+               VALUES (?, ?, COALESCE((SELECT path FROM folders WHERE id = ?) || '/', '') || ?)
+               ON CONFLICT DO NOTHING""",
+            [(folder.name, folder.parent_id, folder.parent_id, folder.name) for folder in folders]
         )
         
         self.db.commit()
-        return cursor.lastrowid
+        return cursor.rowcount
     
     def rename_folder(self, folder_id: int, new_name: str) -> bool:
         """Rename a folder and return success status."""
         cursor = self.db.cursor()
         
-        # Get the current folder information
-        cursor.execute(
-            "SELECT parent_id, path FROM folders WHERE id = ?",
-            (folder_id,)
-        )
-        row = cursor.fetchone()
+        # Get the current folder information together with its parent's path
+        row = self._get_folder_with_parent(folder_id)
         if row is None:
             return False
         
-        parent_id, old_path = row
-        
-        # Check if a folder with the same name already exists at the same level
-        if parent_id is None:
-            cursor.execute(
-                "SELECT COUNT(*) FROM folders WHERE name = ? AND parent_id IS NULL AND id != ?",
-                (new_name, folder_id)
-            )
-        else:
-            cursor.execute(
-                "SELECT COUNT(*) FROM folders WHERE name = ? AND parent_id = ? AND id != ?",
-                (new_name, parent_id, folder_id)
-            )
-        
-        if cursor.fetchone()[0] > 0:
-            raise ValueError(f"A folder named '{new_name}' already exists at this level")
+        _, _, old_path, parent_path = row
         
-        # Calculate the new path
-        old_name = old_path.split('/')[-1]
-        new_path = old_path.replace(old_name, new_name)
+        # Calculate the new path under the same parent
+        new_path = f"{parent_path}/{new_name}" if parent_path is not None else new_name
         
-        # Start a transaction
-        self.db.execute("BEGIN TRANSACTION")
-        
-        try:
-            # Update the folder name and path
+        with self.db.savepoint():
+            # Update the folder name and path; the unique (parent, name) index
+            # skips the row if a sibling already has the new name
             cursor.execute(
-                "UPDATE folders SET name = ?, path = ? WHERE id = ?",
+                "UPDATE OR IGNORE folders SET name = ?, path = ? WHERE id = ?",
                 (new_name, new_path, folder_id)
             )
+            if cursor.rowcount == 0:
+                raise ValueError(f"A folder named '{new_name}' already exists at this level")
             
-            # Update the paths of all subfolders
+            # Rewrite the prefix of every subfolder path in one statement
             cursor.execute(
-                "SELECT id, path FROM folders WHERE path LIKE ?",
-                (f"{old_path}/%",)
+                SQL_REWRITE_SUBFOLDER_PATHS,
+                (new_path, len(old_path) + 1, f"{old_path}/", f"{old_path}0")
             )
-            
-            for subfolder_id, subfolder_path in cursor.fetchall():
-                new_subfolder_path = subfolder_path.replace(old_path, new_path)
-                cursor.execute(
-                    "UPDATE folders SET path = ? WHERE id = ?",
-                    (new_subfolder_path, subfolder_id)
-                )
-            
-            self.db.execute("COMMIT")
-            return True
-        except Exception as e:
-            self.db.execute("ROLLBACK")
-            raise e
+        
+        self.db.commit()
+        return True
     
     def delete_folder(self, folder_id: int) -> bool:
         """Delete a folder and return success status."""
         cursor = self.db.cursor()
         
-        # Check if this is the 'Geral' folder (ID 1), which cannot be deleted
-        if folder_id == 1:
+        # Check if this is the 'Geral' folder, which cannot be deleted
+        if folder_id == self.general_folder_id:
             return False
         
-        # Get all notes in this folder and its subfolders
-        cursor.execute(
-            """SELECT n.id 
-               FROM notes n 
-               JOIN folders f ON n.folder_id = f.id 
-               WHERE f.id = ? OR f.path LIKE (SELECT path || '/%' FROM folders WHERE id = ?)""",
-            (folder_id, folder_id)
-        )
-        
-        note_ids = [row[0] for row in cursor.fetchall()]
-        
-        # Start a transaction
-        self.db.execute("BEGIN TRANSACTION")
-        
-        try:
-            # Move all notes to the 'Geral' folder (ID 1)
-            for note_id in note_ids:
-                cursor.execute(
-                    "UPDATE notes SET folder_id = 1 WHERE id = ?",
-                    (note_id,)
-                )
+        with self.db.savepoint():
+            # Move the notes of this folder and all its subfolders to the
+            # 'Geral' folder in one statement
+            cursor.execute(
+                """UPDATE notes SET folder_id = ?
+                   WHERE folder_id IN (
+                       SELECT id FROM folders
+                       WHERE id = ?
+                          OR (path >= (SELECT path || '/' FROM folders WHERE id = ?)
+                              AND path < (SELECT path || '0' FROM folders WHERE id = ?))
+                   )""",
+                (self.general_folder_id, folder_id, folder_id, folder_id)
+            )
             
             # Delete the folder (subfolders will be deleted via ON DELETE CASCADE)
             cursor.execute("DELETE FROM folders WHERE id = ?", (folder_id,))
-            
-            self.db.execute("COMMIT")
-            return True
-        except Exception as e:
-            self.db.execute("ROLLBACK")
-            raise e
+        
+        self.db.commit()
+        return True
     
     def move_folder(self, folder_id: int, new_parent_id: Optional[int]) -> bool:
         """Move a folder to a new parent and return success status."""
         cursor = self.db.cursor()
         
-        # Check if this is the 'Geral' folder (ID 1), which cannot be moved
-        if folder_id == 1:
+        # Check if this is the 'Geral' folder, which cannot be moved
+        if folder_id == self.general_folder_id:
             return False
         
-        # Get the current folder information
+        # Get the current folder information and the new parent's path in one query
         cursor.execute(
-            "SELECT name, parent_id, path FROM folders WHERE id = ?",
-            (folder_id,)
+            "SELECT name, parent_id, path, (SELECT path FROM folders WHERE id = ?) FROM folders WHERE id = ?",
+            (new_parent_id, folder_id)
         )
         row = cursor.fetchone()
         if row is None:
             return False
         
-        name, old_parent_id, old_path = row
+        name, old_parent_id, old_path, new_parent_path = row
         
         # Check if the folder is already at the requested location
         if old_parent_id == new_parent_id:
             return True
         
         # Check if the new parent exists (if not None)
+        new_path = name
         if new_parent_id is not None:
-            cursor.execute("SELECT id FROM folders WHERE id = ?", (new_parent_id,))
-            if cursor.fetchone() is None:
+            if new_parent_path is None:
                 return False
+            new_path = f"{new_parent_path}/{name}"
             
             # Check if the new parent is the folder itself or one of its subfolders
-            if new_parent_id == folder_id:
+            if new_parent_id == folder_id or new_parent_path.startswith(f"{old_path}/"):
                 return False
-            
-            cursor.execute(
-                "SELECT COUNT(*) FROM folders WHERE id = ? AND path LIKE ?",
-                (new_parent_id, f"{old_path}/%")
-            )
-            if cursor.fetchone()[0] > 0:
-                return False
-        
-        # Check if a folder with the same name already exists at the destination
-        if new_parent_id is None:
-            cursor.execute(
-                "SELECT COUNT(*) FROM folders WHERE name = ? AND parent_id IS NULL AND id != ?",
-                (name, folder_id)
-            )
-        else:
-            cursor.execute(
-                "SELECT COUNT(*) FROM folders WHERE name = ? AND parent_id = ? AND id != ?",
-                (name, new_parent_id, folder_id)
-            )
-        
-        if cursor.fetchone()[0] > 0:
-            raise ValueError(f"A folder named '{name}' already exists at the destination")
-        
-        # Calculate the new path
-        new_path = name
-        if new_parent_id is not None:
-            cursor.execute("SELECT path FROM folders WHERE id = ?", (new_parent_id,))
-            parent_path = cursor.fetchone()[0]
-            new_path = f"{parent_path}/{name}"
-        
-        # Start a transaction
-        self.db.execute("BEGIN TRANSACTION")
         
-        try:
-            # Update the folder's parent and path
+        with self.db.savepoint():
+            # Update the folder's parent and path; the unique (parent, name)
+            # index skips the row if the destination already has that name
             cursor.execute(
-                "UPDATE folders SET parent_id = ?, path = ? WHERE id = ?",
+                "UPDATE OR IGNORE folders SET parent_id = ?, path = ? WHERE id = ?",
                 (new_parent_id, new_path, folder_id)
             )
+            if cursor.rowcount == 0:
+                raise ValueError(f"A folder named '{name}' already exists at the destination")
             
-            # Update the paths of all subfolders
+            # Rewrite the prefix of every subfolder path in one statement
             cursor.execute(
-                "SELECT id, path FROM folders WHERE path LIKE ?",
-                (f"{old_path}/%",)
+                SQL_REWRITE_SUBFOLDER_PATHS,
+                (new_path, len(old_path) + 1, f"{old_path}/", f"{old_path}0")
             )
-            
-            for subfolder_id, subfolder_path in cursor.fetchall():
-                new_subfolder_path = subfolder_path.replace(old_path, new_path)
-                cursor.execute(
-                    "UPDATE folders SET path = ? WHERE id = ?",
-                    (new_subfolder_path, subfolder_id)
-                )
-            
-            self.db.execute("COMMIT")
-            return True
-        except Exception as e:
-            self.db.execute("ROLLBACK")
-            raise e
+        
+        self.db.commit()
+        return True
     
     def get_folder_note_count(self, folder_id: int) -> int:
         """Get the number of notes in a folder."""
-        cursor = self.db.cursor()
-        cursor.execute("SELECT COUNT(*) FROM notes WHERE folder_id = ?", (folder_id,))
-        return cursor.fetchone()[0]
\ No newline at end of file
+        row = self.db.execute(SQL_GET_FOLDER_NOTE_COUNT, (folder_id,)).fetchone()
+        return row[0] if row is not None else 0
+    
+    def get_folder_tree(self) -> List[Tuple[Folder, int, int]]:
+        """Retrieve all folders depth-first as (folder, depth, note_count) tuples."""
+        # Walk down from the top-level folders; always expanding the deepest
+        # pending row first yields a depth-first (pre-order) traversal. Siblings
+        # share their parent's path prefix, so sorting them by path puts them
+        # in name order, with '/Geral' first among the top-level folders as in
+        # get_all_folders
+        cursor = self.db.execute(
+            """WITH RECURSIVE tree (id, name, parent_id, path, note_count, depth) AS (
+                   SELECT id, name, parent_id, path, note_count, 0
+                   FROM folders WHERE parent_id IS NULL
+                   UNION ALL
+                   SELECT f.id, f.name, f.parent_id, f.path, f.note_count, t.depth + 1
+                   FROM folders f JOIN tree t ON f.parent_id = t.id
+                   ORDER BY 6 DESC, 4
+               )
+               SELECT id, name, parent_id, path, depth, note_count FROM tree"""
+        )
+        
+        result = []
+        for row in cursor:
+            result.append((Folder(*row[:4]), row[4], row[5]))
+        
+        return result
+    
+    def _get_folder_with_parent(self, folder_id: int) -> Optional[Tuple[str, Optional[int], str, Optional[str]]]:
+        """Fetch a folder's name, parent ID and path along with its parent's path."""
+        cursor = self.db.execute(
+            """SELECT f.name, f.parent_id, f.path, p.path
+               FROM folders f
+               LEFT JOIN folders p ON p.id = f.parent_id
+               WHERE f.id = ?""",
+            (folder_id,)
+        )
+        return cursor.fetchone()
\ No newline at end of file
@@ -1,154 +1,255 @@
+import sqlite3
 from datetime import datetime
-from typing import List, Optional
+from itertools import starmap
+from typing import Iterator, List, Optional
 
 from domain.entities.note import Note
 from domain.repositories.note_repository import NoteRepository
+from infrastructure.database.attachment_repository_impl import delete_note_attachment_rows, remove_attachment_files
+from infrastructure.database.connection import MAX_IN_PARAMS
+
+# Columns in Note field order; the timestamps are parsed by the registered
+# datetime converter, so rows map straight onto Note(*row)
+NOTE_COLUMNS = (
+    'id, title, content, created_at AS "created_at [datetime]", modified_at AS "modified_at [datetime]", folder_id, version'
+)
+
+SQL_GET_NOTE_BY_ID = (
+    'SELECT n.id, n.title, n.content, n.created_at AS "created_at [datetime]", n.modified_at AS "modified_at [datetime]", '
+    "n.folder_id, n.version, GROUP_CONCAT(a.id) "
+    "FROM notes n LEFT JOIN attachments a ON a.note_id = n.id WHERE n.id = ? GROUP BY n.id"
+)
 
 class NoteRepositoryImpl(NoteRepository):
     """SQLite implementation of the note repository."""
     
     def __init__(self, db_connection):
         self.db = db_connection
+        self.general_folder_id = db_connection.general_folder_id
     
     def get_all_notes(self, folder_id: Optional[int] = None) -> List[Note]:
         """Retrieve all notes, optionally filtered by folder ID."""
+        return list(self.iter_notes(folder_id))
+    
+    def get_notes_page(self, folder_id: Optional[int], limit: int, offset: int) -> List[Note]:
+        """Retrieve a page of notes, most recently modified first, optionally filtered by folder ID."""
+        return list(self.iter_notes(folder_id, limit, offset))
+    
+    def iter_notes(self, folder_id: Optional[int] = None, limit: int = -1, offset: int = 0) -> Iterator[Note]:
+        """Lazily yield notes, most recently modified first, optionally filtered by folder ID."""
         cursor = self.db.cursor()
         
+        # A negative LIMIT means no limit in SQLite
         if folder_id is not None:
             cursor.execute(
-                "SELECT id, title, content, created_at, modified_at, folder_id FROM notes WHERE folder_id = ? ORDER BY modified_at DESC",
-                (folder_id,)
+                f"SELECT {NOTE_COLUMNS} FROM notes WHERE folder_id = ? ORDER BY modified_at DESC LIMIT ? OFFSET ?",
+                (folder_id, limit, offset)
             )
         else:
             cursor.execute(
-                "SELECT id, title, content, created_at, modified_at, folder_id FROM notes ORDER BY modified_at DESC"
+                f"SELECT {NOTE_COLUMNS} FROM notes ORDER BY modified_at DESC LIMIT ? OFFSET ?",
+                (limit, offset)
             )
         
-        notes = []
-        for row in cursor.fetchall():
-            note = Note(
-                id=row[0],
-                title=row[1],
-                content=row[2],
-                created_at=datetime.fromisoformat(row[3]),
-                modified_at=datetime.fromisoformat(row[4]),
-                folder_id=row[5]
-            )
-            notes.append(note)
-        
-        return notes
+        # Build each note as its row is read, so a caller that stops early
+        # never loads the remaining rows
+        yield from starmap(Note, cursor)
     
     def get_note_by_id(self, note_id: int) -> Optional[Note]:
         """Retrieve a note by its ID."""
-        cursor = self.db.cursor()
-        cursor.execute(
-            "SELECT id, title, content, created_at, modified_at, folder_id FROM notes WHERE id = ?",
-            (note_id,)
-        )
-        
-        row = cursor.fetchone()
+        # The note and its attachment IDs come back together as one row
+        row = self.db.execute(SQL_GET_NOTE_BY_ID, (note_id,)).fetchone()
         if row is None:
             return None
         
-        note = Note(
-            id=row[0],
-            title=row[1],
-            content=row[2],
-            created_at=datetime.fromisoformat(row[3]),
-            modified_at=datetime.fromisoformat(row[4]),
-            folder_id=row[5]
+        return Note(
+            *row[:7],
+            attachment_ids=[int(attachment_id) for attachment_id in row[7].split(",")] if row[7] else []
         )
+    
+    def get_notes_by_ids(self, note_ids: List[int]) -> List[Note]:
+        """Retrieve the notes matching the given IDs, in the order of the IDs."""
+        cursor = self.db.cursor()
+        notes = []
         
-        # Get attachment IDs for this note
-        cursor.execute("SELECT id FROM attachments WHERE note_id = ?", (note_id,))
-        attachment_ids = [row[0] for row in cursor.fetchall()]
-        note.attachment_ids = attachment_ids
+        for start in range(0, len(note_ids), MAX_IN_PARAMS):
+            chunk = note_ids[start:start + MAX_IN_PARAMS]
+            placeholders = ", ".join(["?" for _ in chunk])
+            
+            cursor.execute(
+                f"SELECT {NOTE_COLUMNS} FROM notes WHERE id IN ({placeholders})",
+                chunk
+            )
+            
+            notes_by_id = {}
+            for note in starmap(Note, cursor):
+                notes_by_id[note.id] = note
+                notes.append(note)
+            
+            # Get attachment IDs for the whole chunk at once
+            cursor.execute(
+                f"SELECT note_id, id FROM attachments WHERE note_id IN ({placeholders})",
+                chunk
+            )
+            for note_id, attachment_id in cursor:
+                notes_by_id[note_id].attachment_ids.append(attachment_id)
         
-        return note
+        # Each chunk comes back in table order
+        position = {note_id: index for index, note_id in enumerate(note_ids)}
+        notes.sort(key=lambda note: position[note.id])
+        return notes
     
     def add_note(self, note: Note) -> int:
         """Add a new note and return its ID."""
-        cursor = self.db.cursor()
+        # Ensure folder_id is set (default to the 'Geral' folder)
+        folder_id = note.folder_id if note.folder_id is not None else self.general_folder_id
         
-        # Ensure folder_id is set (default to 'Geral' folder with ID 1)
-        folder_id = note.folder_id if note.folder_id is not None else 1
+        cursor = self.db.execute(
+            "INSERT INTO notes (title, content, created_at, modified_at, folder_id) VALUES (?, ?, ?, ?, ?) RETURNING id",
+            (note.title, note.content, note.created_at.isoformat(), note.modified_at.isoformat(), folder_id)
+        )
+        note_id = cursor.fetchone()[0]
         
-        cursor.execute(
+        self.db.commit()
+        return note_id
+    
+    def add_notes_bulk(self, notes: List[Note]) -> int:
+        """Add several notes in a single transaction and return how many were inserted."""
+        cursor = self.db.executemany(
             "INSERT INTO notes (title, content, created_at, modified_at, folder_id) VALUES (?, ?, ?, ?, ?)",
-            (note.title, note.content, note.created_at.isoformat(), note.modified_at.isoformat(), folder_id)
+            [
+                (
+                    note.title,
+                    note.content,
+                    note.created_at.isoformat(),
+                    note.modified_at.isoformat(),
+                    note.folder_id if note.folder_id is not None else self.general_folder_id
+                )
+                for note in notes
+            ]
         )
         
         self.db.commit()
-        return cursor.lastrowid
+        return cursor.rowcount
     
     def update_note(self, note: Note) -> bool:
         """Update an existing note and return success status."""
         if note.id is None:
             return False
         
-        cursor = self.db.cursor()
-        cursor.execute(
-            "UPDATE notes SET title = ?, content = ?, modified_at = ? WHERE id = ?",
-            (note.title, note.content, note.modified_at.isoformat(), note.id)
+        # Only write over the version that was read; a concurrent update bumps
+        # the version and makes this one fail instead of silently losing data
+        cursor = self.db.execute(
+            "UPDATE notes SET title = ?, content = ?, modified_at = ?, version = version + 1 WHERE id = ? AND version = ?",
+            (note.title, note.content, note.modified_at.isoformat(), note.id, note.version)
         )
         
         self.db.commit()
-        return cursor.rowcount > 0
+        if cursor.rowcount == 0:
+            return False
+        
+        note.version += 1
+        return True
     
     def delete_note(self, note_id: int) -> bool:
         """Delete a note by its ID and return success status."""
-        cursor = self.db.cursor()
-        
-        # First, delete all attachments for this note
-        cursor.execute("SELECT id FROM attachments WHERE note_id = ?", (note_id,))
-        attachment_ids = [row[0] for row in cursor.fetchall()]
-        
-        for attachment_id in attachment_ids:
-            # Get the file path to delete the physical file
-            cursor.execute("SELECT file_path FROM attachments WHERE id = ?", (attachment_id,))
-            file_path = cursor.fetchone()[0]
-            
-            # Delete the attachment record
-            cursor.execute("DELETE FROM attachments WHERE id = ?", (attachment_id,))
-            
-            # Delete the physical file (this would be handled by a file system service in a real implementation)
-            # os.remove(file_path)
+        # Drop the attachment rows in the same transaction as the note
+        file_paths = delete_note_attachment_rows(self.db, note_id)
         
-        # Now delete the note
-        cursor.execute("DELETE FROM notes WHERE id = ?", (note_id,))
+        cursor = self.db.execute("DELETE FROM notes WHERE id = ?", (note_id,))
+        deleted = cursor.rowcount > 0
         
         self.db.commit()
-        return cursor.rowcount > 0
+        
+        remove_attachment_files(file_paths)
+        return deleted
     
     def move_note(self, note_id: int, folder_id: int) -> bool:
         """Move a note to a different folder and return success status."""
-        cursor = self.db.cursor()
-        cursor.execute(
-            "UPDATE notes SET folder_id = ?, modified_at = ? WHERE id = ?",
-            (folder_id, datetime.now().isoformat(), note_id)
-        )
+        # The folder foreign key rejects a target folder that does not exist,
+        # so there is no need to look it up first
+        try:
+            with self.db.savepoint():
+                cursor = self.db.execute(
+                    "UPDATE notes SET folder_id = ?, modified_at = ? WHERE id = ?",
+                    (folder_id, datetime.now().isoformat(), note_id)
+                )
+        except sqlite3.IntegrityError:
+            return False
         
         self.db.commit()
         return cursor.rowcount > 0
     
     def search_notes(self, criteria) -> List[Note]:
-        """Search for notes based on the provided criteria."""
-        cursor = self.db.cursor()
+        """Search for notes based on the provided criteria, without their content."""
+        # The full-text index folds case, so it only serves case-insensitive
+        # searches, and it indexes trigrams, so it cannot look up shorter terms
+        if criteria.case_sensitive or len(criteria.search_term) < 3:
+            return self._search_notes_like(criteria)
+        
+        query = """SELECT n.id, n.title, n.created_at AS "created_at [datetime]", n.modified_at AS "modified_at [datetime]", n.folder_id, n.version, f.name as folder_name 
+                 FROM notes_fts 
+                 JOIN notes n ON n.id = notes_fts.rowid 
+                 JOIN folders f ON n.folder_id = f.id 
+                 WHERE notes_fts MATCH ?"""
+        params = [self._build_match_expression(criteria)]
+        
+        # Add folder filter if specified
+        if criteria.folder_ids:
+            placeholders = ", ".join(["?" for _ in criteria.folder_ids])
+            query += f" AND n.folder_id IN ({placeholders})"
+            params.extend(criteria.folder_ids)
+        
+        query += " ORDER BY n.modified_at DESC"
+        
+        cursor = self.db.execute(query, params)
+        
+        # Build the notes straight off the cursor rather than materializing
+        # every row tuple in a list first; results are listed by title, so the
+        # (possibly large) content is left out and loaded when a note is opened
+        notes = []
+        for row in cursor:
+            note = Note(
+                id=row[0],
+                title=row[1],
+                created_at=row[2],
+                modified_at=row[3],
+                folder_id=row[4],
+                version=row[5],
+                folder_name=row[6]
+            )
+            notes.append(note)
+        
+        return notes
+    
+    @staticmethod
+    def _build_match_expression(criteria) -> str:
+        """Build an FTS5 MATCH expression from the search criteria."""
+        # Quote the whole term so user input is never parsed as query syntax;
+        # with the trigram tokenizer a quoted string matches as a substring
+        phrase = '"{}"'.format(criteria.search_term.replace('"', '""'))
+        
+        if criteria.include_title and criteria.include_content:
+            return phrase
+        
+        column = "title" if criteria.include_title else "content"
+        return f"{column} : {phrase}"
+    
+    def _search_notes_like(self, criteria) -> List[Note]:
+        """Search for notes with a substring scan over titles and contents."""
         search_term = criteria.search_term
         
-        # Apply case sensitivity
-        if not criteria.case_sensitive:
-            search_term = search_term.lower()
-            title_clause = "LOWER(n.title) LIKE ?"
-            content_clause = "LOWER(n.content) LIKE ?"
+        # LIKE always folds ASCII case and treats % and _ as wildcards, so
+        # match with instr() instead, folding case only when asked to
+        if criteria.case_sensitive:
+            title_clause = "instr(n.title, ?) > 0"
+            content_clause = "instr(n.content, ?) > 0"
         else:
-            title_clause = "n.title LIKE ?"
-            content_clause = "n.content LIKE ?"
-        
-        search_pattern = f"%{search_term}%"
+            title_clause = "instr(lower(n.title), lower(?)) > 0"
+            content_clause = "instr(lower(n.content), lower(?)) > 0"
         
         # Build the query based on search criteria
-        query = """SELECT n.id, n.title, n.content, n.created_at, n.modified_at, n.folder_id, f.name as folder_name 
+        query = """SELECT n.id, n.title, n.created_at AS "created_at [datetime]", n.modified_at AS "modified_at [datetime]", n.folder_id, n.version, f.name as folder_name 
                  FROM notes n 
                  JOIN folders f ON n.folder_id = f.id 
                  WHERE """
@@ -156,45 +257,46 @@ class NoteRepositoryImpl(NoteRepository):
         conditions = []
         params = []
         
+        # Add the folder filter first, so the indexed folder_id check narrows
+        # the notes before any content is scanned
+        if criteria.folder_ids:
+            placeholders = ", ".join(["?" for _ in criteria.folder_ids])
+            query += f"n.folder_id IN ({placeholders}) AND "
+            params.extend(criteria.folder_ids)
+        
         # Add title condition if needed
         if criteria.include_title:
             conditions.append(f"({title_clause})")
-            params.append(search_pattern)
+            params.append(search_term)
         
         # Add content condition if needed
         if criteria.include_content:
             conditions.append(f"({content_clause})")
-            params.append(search_pattern)
+            params.append(search_term)
         
-        # Combine conditions with OR
+        # Combine conditions with OR; the parentheses keep the folder filter
+        # applying to every condition, not just the last one
         if conditions:
-            query += " OR ".join(conditions)
+            query += "(" + " OR ".join(conditions) + ")"
         else:
             # If no conditions, return empty list
             return []
         
-        # Add folder filter if specified
-        if criteria.folder_ids:
-            placeholders = ", ".join(["?" for _ in criteria.folder_ids])
-            query += f" AND n.folder_id IN ({placeholders})"
-            params.extend(criteria.folder_ids)
-        
         query += " ORDER BY n.modified_at DESC"
         
-        cursor.execute(query, params)
+        cursor = self.db.execute(query, params)
         
         notes = []
-        for row in cursor.fetchall():
+        for row in cursor:
             note = Note(
                 id=row[0],
                 title=row[1],
-                content=row[2],
-                created_at=datetime.fromisoformat(row[3]),
-                modified_at=datetime.fromisoformat(row[4]),
-                folder_id=row[5]
+                created_at=row[2],
+                modified_at=row[3],
+                folder_id=row[4],
+                version=row[5],
+                folder_name=row[6]
             )
-            # Add folder name as a property for display purposes
-            note.folder_name = row[6]
             notes.append(note)
         
         return notes
\ No newline at end of file
@@ -4,6 +4,14 @@ import uuid
 from datetime import datetime
 from typing import Optional, Tuple
 
+# Attachment type for each known extension, resolved with a single dict lookup
+FILE_TYPES_BY_EXTENSION = {
+    **dict.fromkeys((".jpg", ".jpeg", ".png", ".gif", ".bmp", ".tiff"), "image"),
+    **dict.fromkeys((".pdf", ".doc", ".docx", ".txt", ".rtf", ".odt"), "document"),
+    **dict.fromkeys((".xls", ".xlsx", ".csv", ".ods"), "spreadsheet"),
+    **dict.fromkeys((".ppt", ".pptx", ".odp"), "presentation")
+}
+
 class FileStorage:
     """Class responsible for handling file storage operations."""
     
@@ -11,6 +19,10 @@ class FileStorage:
         """Initialize with the base storage directory path."""
         self.base_storage_path = base_storage_path
         
+        # Note directories already created by this instance, so repeated
+        # attachments to the same note skip the mkdir calls
+        self._note_dirs = set()
+        
         # Ensure the storage directory exists
         os.makedirs(self.base_storage_path, exist_ok=True)
     
@@ -24,26 +36,31 @@ class FileStorage:
         Returns:
             Tuple containing (file_path, file_name, file_type)
         """
-        if not os.path.exists(source_path):
-            raise FileNotFoundError(f"Source file not found: {source_path}")
-        
-        # Create a directory for the note's attachments if it doesn't exist
+        # Create a directory for the note's attachments if it doesn't exist; a
+        # missing source is not checked up front, as the copy below raises
+        # FileNotFoundError for it
         note_dir = os.path.join(self.base_storage_path, f"note_{note_id}")
-        os.makedirs(note_dir, exist_ok=True)
+        if note_dir not in self._note_dirs:
+            os.makedirs(note_dir, exist_ok=True)
+            self._note_dirs.add(note_dir)
         
         # Get file name and extension
         file_name = os.path.basename(source_path)
         file_ext = os.path.splitext(file_name)[1].lower()
         
         # Generate a unique filename to avoid collisions
-        unique_id = str(uuid.uuid4())
+        unique_id = uuid.uuid4().hex
         unique_filename = f"{unique_id}{file_ext}"
         
         # Destination path
         dest_path = os.path.join(note_dir, unique_filename)
         
-        # Copy the file
-        shutil.copy2(source_path, dest_path)
+        # Copy only the contents: copyfile() copies in the kernel (sendfile on
+        # Linux, fcopyfile on macOS), and nothing reads the source's metadata
+        # back, so copy2()'s extra stat/utime/chmod/xattr calls are skipped. A
+        # hard link would be free, but edits to the original would then change
+        # the attachment too
+        shutil.copyfile(source_path, dest_path)
         
         # Determine file type
         file_type = self._get_file_type(file_ext)
@@ -69,6 +86,7 @@ class FileStorage:
             dir_path = os.path.dirname(file_path)
             if os.path.exists(dir_path) and not os.listdir(dir_path):
                 os.rmdir(dir_path)
+                self._note_dirs.discard(dir_path)
                 
             return True
         except OSError:
@@ -83,18 +101,4 @@ class FileStorage:
         Returns:
             A string representing the file type
         """
-        image_extensions = [".jpg", ".jpeg", ".png", ".gif", ".bmp", ".tiff"]
-        document_extensions = [".pdf", ".doc", ".docx", ".txt", ".rtf", ".odt"]
-        spreadsheet_extensions = [".xls", ".xlsx", ".csv", ".ods"]
-        presentation_extensions = [".ppt", ".pptx", ".odp"]
-        
-        if extension in image_extensions:
-            return "image"
-        elif extension in document_extensions:
-            return "document"
-        elif extension in spreadsheet_extensions:
-            return "spreadsheet"
-        elif extension in presentation_extensions:
-            return "presentation"
-        else:
-            return "other"
\ No newline at end of file
+        return FILE_TYPES_BY_EXTENSION.get(extension, "other")
\ No newline at end of file
@@ -2,12 +2,15 @@ import sys
 import os
 import traceback
 from PyQt5.QtWidgets import QApplication, QMessageBox
-from PyQt5.QtCore import Qt, QFile, QTextStream
+from PyQt5.QtCore import Qt
 
 from presentation.main_window import MainWindow
 from shared.utils.logger import Logger
 from shared.constants import APP_NAME, APP_VERSION
 
+# Application stylesheet, resolved once at import
+STYLESHEET_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'assets', 'style.qss')
+
 # Set up high DPI scaling
 QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
 QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
@@ -49,13 +52,14 @@ def main():
     app.setApplicationName(APP_NAME)
     app.setApplicationVersion(APP_VERSION)
     
-    # Load application stylesheet
-    style_file = QFile(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'assets', 'style.qss'))
-    if style_file.exists():
-        style_file.open(QFile.ReadOnly | QFile.Text)
-        stream = QTextStream(style_file)
-        app.setStyleSheet(stream.readAll())
-        style_file.close()
+    # Load application stylesheet in a single read; opening it directly
+    # replaces the separate existence check, and a missing file just leaves
+    # the default style
+    try:
+        with open(STYLESHEET_PATH, encoding='utf-8') as style_file:
+            app.setStyleSheet(style_file.read())
+    except OSError:
+        pass
     
     # Create main window
     window = MainWindow()
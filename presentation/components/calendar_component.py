@@ -62,8 +62,9 @@ class EventDialog(QDialog):
         
         # Description input
         self.description_input = QTextEdit(self)
+        self.description_input.setAcceptRichText(False)  # Descriptions are stored as plain text
         if self.event:
-            self.description_input.setText(self.event.get('description', ''))
+            self.description_input.setPlainText(self.event.get('description', ''))
         form_layout.addRow("Description:", self.description_input)
         
         layout.addLayout(form_layout)
@@ -123,6 +124,15 @@ class CalendarComponent(BaseComponent):
         
         # Event data
         self.events_by_date = {}
+        
+        # Dates (ISO strings) currently highlighted as having events
+        self.highlighted_dates = set()
+        
+        # Format for dates with events, built once and shared by every date
+        self.event_format = QTextCharFormat()
+        self.event_format.setBackground(QColor(200, 230, 255))
+        self.event_format.setForeground(QColor(0, 0, 150))
+        self.event_format.setFontWeight(700)  # Bold font
     
     def _init_ui(self):
         """Initialize the UI components."""
@@ -295,20 +305,19 @@ class CalendarComponent(BaseComponent):
         year = self.calendar.yearShown()
         
         # Get dates with events
-        dates_with_events = event_controller.get_dates_with_events(year, month)
-        
-        # Clear all date formats
-        self.calendar.setDateTextFormat(QDate(), QTextCharFormat())
+        dates_with_events = set(event_controller.get_dates_with_events(year, month))
         
-        # Set format for dates with events
-        event_format = QTextCharFormat()
-        event_format.setBackground(QColor(200, 230, 255))
-        event_format.setForeground(QColor(0, 0, 150))
-        event_format.setFontWeight(700)  # Bold font
+        # Only restyle the dates whose highlight changed, instead of clearing
+        # every format and setting them all again
+        for date_str in self.highlighted_dates - dates_with_events:
+            date = QDate.fromString(date_str, Qt.ISODate)
+            self.calendar.setDateTextFormat(date, QTextCharFormat())
         
-        for date_str in dates_with_events:
+        for date_str in dates_with_events - self.highlighted_dates:
             date = QDate.fromString(date_str, Qt.ISODate)
-            self.calendar.setDateTextFormat(date, event_format)
+            self.calendar.setDateTextFormat(date, self.event_format)
+        
+        self.highlighted_dates = dates_with_events
     
     def _update_events_display(self):
         """Update the events display for the selected date."""
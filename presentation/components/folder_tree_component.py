@@ -167,10 +167,13 @@ class FolderTreeComponent(BaseComponent):
         # Get all folders
         folders = folder_controller.get_all_folders()
         
+        # The current folder and its descendants, fetched in one query
+        excluded_ids = {folder['id'] for folder in folder_controller.get_folder_subtree(folder_id)}
+        
         # Add folder actions
         for folder in folders:
             # Skip the current folder and its descendants
-            if folder['id'] == folder_id or self._is_descendant(folder['id'], folder_id):
+            if folder['id'] in excluded_ids:
                 continue
             
             action = QAction(folder['name'], self)
@@ -182,35 +185,6 @@ class FolderTreeComponent(BaseComponent):
         action.triggered.connect(lambda: self._move_folder(folder_id, None))
         menu.addAction(action)
     
-    def _is_descendant(self, folder_id: int, potential_ancestor_id: int) -> bool:
-        """Check if a folder is a descendant of another folder.
-        
-        Args:
-            folder_id: The folder ID to check
-            potential_ancestor_id: The potential ancestor folder ID
-            
-        Returns:
-            True if folder_id is a descendant of potential_ancestor_id, False otherwise
-        """
-        folder_controller = self.controllers.get('folder_controller')
-        if not folder_controller:
-            return False
-        
-        folder = folder_controller.get_folder_by_id(folder_id)
-        if not folder:
-            return False
-        
-        # If this folder's parent is the potential ancestor, it's a descendant
-        if folder.get('parent_id') == potential_ancestor_id:
-            return True
-        
-        # If this folder has no parent, it's not a descendant
-        if folder.get('parent_id') is None:
-            return False
-        
-        # Recursively check if the parent is a descendant
-        return self._is_descendant(folder.get('parent_id'), potential_ancestor_id)
-    
     def _create_folder(self, parent_id: int):
         """Create a new folder.
         
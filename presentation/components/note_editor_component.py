@@ -47,6 +47,7 @@ class NoteEditorComponent(BaseComponent):
         # Content editor
         self.content_editor = QTextEdit(self)
         self.content_editor.setPlaceholderText("Write your note here...")
+        self.content_editor.setAcceptRichText(False)  # Notes are stored as plain text
         self.content_editor.setStyleSheet("font-size: 14px; padding: 5px;")
         main_layout.addWidget(self.content_editor)
         
@@ -141,7 +142,9 @@ class NoteEditorComponent(BaseComponent):
         
         # Update UI
         self.title_input.setText(note.get('title', ''))
-        self.content_editor.setText(note.get('content', ''))
+        # Notes are plain text; setText() would first scan the content for
+        # markup and parse anything that looks like HTML
+        self.content_editor.setPlainText(note.get('content', ''))
         self.delete_btn.setEnabled(True)
         
         # Load attachments
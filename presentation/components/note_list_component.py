@@ -1,10 +1,99 @@
 from typing import List, Dict, Any, Optional, Callable
-from PyQt5.QtWidgets import QListWidget, QListWidgetItem, QMenu, QAction, QMessageBox
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtWidgets import QListView, QMenu, QAction, QMessageBox
+from PyQt5.QtCore import Qt, pyqtSignal, QAbstractListModel, QModelIndex
 
 from presentation.components.base_component import BaseComponent
 from shared.utils.string_utils import StringUtils
 
+class NoteListModel(QAbstractListModel):
+    """List model serving note titles straight from the note dictionaries.
+    
+    Unlike a QListWidget, no item object is created per row; the view asks
+    for the data of the rows it actually paints.
+    """
+    
+    def __init__(self, parent=None):
+        """Initialize the model.
+        
+        Args:
+            parent: The parent object
+        """
+        super().__init__(parent)
+        self._notes = []
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        """Get the number of notes in the model.
+        
+        Args:
+            parent: The parent index; a list has no children
+            
+        Returns:
+            The number of rows
+        """
+        return 0 if parent.isValid() else len(self._notes)
+    
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        """Get the data shown for a note.
+        
+        Args:
+            index: The index of the note
+            role: The data role requested by the view
+            
+        Returns:
+            The title for display, a content preview for tooltips, the note ID
+            for the user role, or None
+        """
+        if not index.isValid():
+            return None
+        
+        note = self._notes[index.row()]
+        if role == Qt.DisplayRole:
+            return note['title']
+        if role == Qt.UserRole:
+            return note['id']
+        if role == Qt.ToolTipRole and note['content']:
+            # Previews are only built for the rows that are hovered
+            return StringUtils.truncate(note['content'], 100)
+        return None
+    
+    def set_notes(self, notes: List[Dict[str, Any]]):
+        """Replace all the notes in the model.
+        
+        Args:
+            notes: The notes to show
+        """
+        self.beginResetModel()
+        self._notes = notes
+        self.endResetModel()
+    
+    def row_of(self, note_id: int) -> int:
+        """Get the row of a note.
+        
+        Args:
+            note_id: The note ID
+            
+        Returns:
+            The row of the note, or -1 if it is not in the model
+        """
+        for row, note in enumerate(self._notes):
+            if note['id'] == note_id:
+                return row
+        return -1
+    
+    def remove_note(self, note_id: int):
+        """Remove a note from the model, if present.
+        
+        Args:
+            note_id: The note ID
+        """
+        row = self.row_of(note_id)
+        if row < 0:
+            return
+        
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._notes[row]
+        self.endRemoveRows()
+
 class NoteListComponent(BaseComponent):
     """Component for displaying and managing a list of notes."""
     
@@ -30,21 +119,25 @@ class NoteListComponent(BaseComponent):
     
     def _init_ui(self):
         """Initialize the UI components."""
-        # Create list widget
-        self.list_widget = QListWidget(self)
-        self.list_widget.setContextMenuPolicy(Qt.CustomContextMenu)
+        # Create the list view over a model of the notes; every row is one
+        # line of text, so the view can skip measuring each row
+        self.model = NoteListModel(self)
+        self.list_view = QListView(self)
+        self.list_view.setModel(self.model)
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.setContextMenuPolicy(Qt.CustomContextMenu)
         
         # Set up layout
         from PyQt5.QtWidgets import QVBoxLayout
         layout = QVBoxLayout()
-        layout.addWidget(self.list_widget)
+        layout.addWidget(self.list_view)
         self.setLayout(layout)
     
     def _connect_signals(self):
         """Connect signals and slots."""
-        # Connect list widget signals
-        self.list_widget.itemClicked.connect(self._on_item_clicked)
-        self.list_widget.customContextMenuRequested.connect(self._show_context_menu)
+        # Connect list view signals
+        self.list_view.clicked.connect(self._on_item_clicked)
+        self.list_view.customContextMenuRequested.connect(self._show_context_menu)
     
     def set_folder(self, folder_id: int):
         """Set the current folder and load its notes.
@@ -60,43 +153,26 @@ class NoteListComponent(BaseComponent):
         if self.current_folder_id is None:
             return
         
-        # Clear the list
-        self.list_widget.clear()
-        
         # Get notes for the current folder
         note_controller = self.controllers.get('note_controller')
-        if note_controller:
-            self.notes = note_controller.get_notes_by_folder(self.current_folder_id)
-            
-            # Add notes to the list
-            for note in self.notes:
-                self._add_note_to_list(note)
-    
-    def _add_note_to_list(self, note: Dict[str, Any]):
-        """Add a note to the list widget.
-        
-        Args:
-            note: The note data
-        """
-        # Create list item
-        item = QListWidgetItem(note['title'])
-        item.setData(Qt.UserRole, note['id'])  # Store note ID as user data
+        if not note_controller:
+            return
         
-        # Add a tooltip with a preview of the content
-        if note['content']:
-            preview = StringUtils.truncate(note['content'], 100)
-            item.setToolTip(preview)
+        self.notes = note_controller.get_notes_by_folder(self.current_folder_id)
         
-        # Add item to the list
-        self.list_widget.addItem(item)
+        # Swap the model's rows in one reset, keeping the selected note selected
+        current_note_id = self.list_view.currentIndex().data(Qt.UserRole)
+        self.model.set_notes(self.notes)
+        if current_note_id is not None:
+            self.select_note(current_note_id)
     
-    def _on_item_clicked(self, item: QListWidgetItem):
+    def _on_item_clicked(self, index: QModelIndex):
         """Handle item click event.
         
         Args:
-            item: The clicked item
+            index: The index of the clicked item
         """
-        note_id = item.data(Qt.UserRole)
+        note_id = index.data(Qt.UserRole)
         self.note_selected.emit(note_id)
     
     def _show_context_menu(self, position):
@@ -106,12 +182,12 @@ class NoteListComponent(BaseComponent):
             position: The position where to show the menu
         """
         # Get the item at the position
-        item = self.list_widget.itemAt(position)
-        if not item:
+        index = self.list_view.indexAt(position)
+        if not index.isValid():
             return
         
         # Get the note ID
-        note_id = item.data(Qt.UserRole)
+        note_id = index.data(Qt.UserRole)
         
         # Create context menu
         menu = QMenu(self)
@@ -126,7 +202,7 @@ class NoteListComponent(BaseComponent):
         self._populate_move_menu(move_menu, note_id)
         
         # Show the menu
-        menu.exec_(self.list_widget.mapToGlobal(position))
+        menu.exec_(self.list_view.mapToGlobal(position))
     
     def _populate_move_menu(self, menu: QMenu, note_id: int):
         """Populate the move to folder submenu.
@@ -171,11 +247,7 @@ class NoteListComponent(BaseComponent):
             note_controller = self.controllers.get('note_controller')
             if note_controller and note_controller.delete_note(note_id):
                 # Remove the note from the list
-                for i in range(self.list_widget.count()):
-                    item = self.list_widget.item(i)
-                    if item.data(Qt.UserRole) == note_id:
-                        self.list_widget.takeItem(i)
-                        break
+                self.model.remove_note(note_id)
                 
                 # Emit signal
                 self.note_deleted.emit(note_id)
@@ -190,11 +262,7 @@ class NoteListComponent(BaseComponent):
         note_controller = self.controllers.get('note_controller')
         if note_controller and note_controller.move_note(note_id, target_folder_id):
             # Remove the note from the list
-            for i in range(self.list_widget.count()):
-                item = self.list_widget.item(i)
-                if item.data(Qt.UserRole) == note_id:
-                    self.list_widget.takeItem(i)
-                    break
+            self.model.remove_note(note_id)
             
             # Emit signal
             self.note_moved.emit(note_id, target_folder_id)
@@ -205,9 +273,7 @@ class NoteListComponent(BaseComponent):
         Args:
             note_id: The note ID
         """
-        # Find the item with the given note ID
-        for i in range(self.list_widget.count()):
-            item = self.list_widget.item(i)
-            if item.data(Qt.UserRole) == note_id:
-                self.list_widget.setCurrentItem(item)
-                break
\ No newline at end of file
+        # Find the row with the given note ID
+        row = self.model.row_of(note_id)
+        if row >= 0:
+            self.list_view.setCurrentIndex(self.model.index(row))
\ No newline at end of file
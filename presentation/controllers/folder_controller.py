@@ -47,6 +47,22 @@ class FolderController:
             self.logger.error(f"Error getting folder {folder_id}: {str(e)}")
             return None
     
+    def get_folder_subtree(self, folder_id: int) -> List[Dict[str, Any]]:
+        """Get a folder together with all folders nested below it.
+        
+        Args:
+            folder_id: The ID of the subtree's root folder
+            
+        Returns:
+            A list of dictionaries representing the folders in the subtree
+        """
+        try:
+            folders = self.folder_service.get_folder_subtree(folder_id)
+            return [self._folder_to_dict(folder) for folder in folders]
+        except Exception as e:
+            self.logger.error(f"Error getting subtree of folder {folder_id}: {str(e)}")
+            return []
+    
     def get_folder_hierarchy(self) -> List[Dict[str, Any]]:
         """Get the folder hierarchy.
         
@@ -54,7 +70,7 @@ class FolderController:
             A list of dictionaries representing the folder hierarchy
         """
         try:
-            hierarchy = self.folder_service.get_folder_hierarchy()
+            hierarchy = self.folder_service.get_hierarchy_with_counts()
             return self._process_hierarchy(hierarchy)
         except Exception as e:
             self.logger.error(f"Error getting folder hierarchy: {str(e)}")
@@ -178,21 +194,21 @@ class FolderController:
             'is_root': folder.is_root
         }
     
-    def _process_hierarchy(self, hierarchy: List[Tuple[Folder, int]]) -> List[Dict[str, Any]]:
+    def _process_hierarchy(self, hierarchy: List[Tuple[Folder, int, int]]) -> List[Dict[str, Any]]:
         """Process the folder hierarchy to add additional information.
         
         Args:
-            hierarchy: The folder hierarchy from the service as a list of (folder, depth) tuples
+            hierarchy: The folder hierarchy from the service as a list of (folder, depth, note_count) tuples
             
         Returns:
             The processed folder hierarchy
         """
         result = []
         
-        for folder, depth in hierarchy:
+        for folder, depth, note_count in hierarchy:
             folder_dict = self._folder_to_dict(folder)
             folder_dict['depth'] = depth
-            folder_dict['note_count'] = self.get_folder_note_count(folder_dict['id'])
+            folder_dict['note_count'] = note_count
             
             # Children are processed separately in the tree component
             
@@ -210,17 +226,7 @@ class FolderController:
         Returns:
             True if folder_id is a descendant of potential_ancestor_id, False otherwise
         """
-        folder = self.folder_service.get_folder_by_id(folder_id)
-        if not folder:
-            return False
-        
-        # If this folder's parent is the potential ancestor, it's a descendant
-        if folder.parent_id == potential_ancestor_id:
-            return True
-        
-        # If this folder has no parent, it's not a descendant
-        if folder.parent_id is None:
-            return False
-        
-        # Recursively check if the parent is a descendant
-        return self._is_descendant(folder.parent_id, potential_ancestor_id)
\ No newline at end of file
+        # Fetch the whole ancestor chain in one query instead of climbing it
+        # one folder lookup at a time
+        ancestors = self.folder_service.get_ancestors(folder_id)
+        return any(ancestor.id == potential_ancestor_id for ancestor in ancestors)
\ No newline at end of file
@@ -137,13 +137,11 @@ class NoteController:
             True if the move was successful, False otherwise
         """
         try:
-            # Validate folder exists
-            folder = self.folder_service.get_folder_by_id(target_folder_id)
-            if not folder:
-                self.logger.error(f"Cannot move note: Folder {target_folder_id} not found")
-                return False
-            
-            return self.note_service.move_note(note_id, target_folder_id)
+            # An unknown target folder is rejected by the repository's foreign key
+            moved = self.note_service.move_note(note_id, target_folder_id)
+            if not moved:
+                self.logger.error(f"Cannot move note {note_id} to folder {target_folder_id}")
+            return moved
         except Exception as e:
             self.logger.error(f"Error moving note {note_id} to folder {target_folder_id}: {str(e)}")
             return False
@@ -173,9 +171,13 @@ class NoteController:
                 case_sensitive=case_sensitive
             )
             
-            # Perform the search
-            notes = self.note_service.search_notes(criteria)
-            return [self._note_to_dict(note) for note in notes]
+            # Perform the search; results carry their folder name for display
+            results = []
+            for note in self.note_service.search_notes(criteria):
+                result = self._note_to_dict(note)
+                result['folder_name'] = note.folder_name
+                results.append(result)
+            return results
         except Exception as e:
             self.logger.error(f"Error searching notes: {str(e)}")
             return []
@@ -131,6 +131,9 @@ class MainWindow(QMainWindow):
             'attachment_controller': self.container.get_attachment_controller()
         }
         
+        # The calendar is only loaded the first time its tab is shown
+        self.calendar_loaded = False
+        
         # Initialize UI
         self.init_ui()
         
@@ -260,11 +263,29 @@ class MainWindow(QMainWindow):
         
         # Connect search signals
         self.search.note_selected.connect(self.on_search_note_selected)
+        
+        # Connect tab signals
+        self.tabs.currentChanged.connect(self.on_tab_changed)
     
     def refresh_all(self):
         """Refresh all components."""
         self.folder_tree.refresh()
-        self.calendar.refresh()
+        
+        # Leave the calendar's event queries off startup until it is first shown
+        if self.calendar_loaded:
+            self.calendar.refresh()
+    
+    def on_tab_changed(self, index):
+        """Handle tab change.
+        
+        Args:
+            index: The index of the newly shown tab
+        """
+        # Load the calendar the first time its tab is shown; from then on it
+        # refreshes itself as events change
+        if self.tabs.widget(index) is self.calendar and not self.calendar_loaded:
+            self.calendar_loaded = True
+            self.calendar.refresh()
     
     def on_folder_selected(self, folder_id):
         """Handle folder selection.
@@ -297,12 +318,12 @@ class MainWindow(QMainWindow):
         # Load note in editor
         self.note_editor.load_note(note_id)
         
-        # Update status
-        note_controller = self.controllers.get('note_controller')
-        if note_controller:
-            note = note_controller.get_note_by_id(note_id)
-            if note:
-                self.status_bar.showMessage(f"Note: {note['title']}")
+        # Update status from the note the editor just loaded, rather than
+        # fetching it a second time; if it could not be loaded, the editor
+        # still holds the previous note
+        note = self.note_editor.current_note
+        if note and note['id'] == note_id:
+            self.status_bar.showMessage(f"Note: {note['title']}")
     
     def on_search_note_selected(self, note_id):
         """Handle note selection from search results.
@@ -336,12 +357,10 @@ class MainWindow(QMainWindow):
         # Refresh note list
         self.note_list.refresh()
         
-        # Update status
-        note_controller = self.controllers.get('note_controller')
-        if note_controller:
-            note = note_controller.get_note_by_id(note_id)
-            if note:
-                self.status_bar.showMessage(f"Note saved: {note['title']}")
+        # Update status from the note the editor just saved
+        note = self.note_editor.current_note
+        if note and note['id'] == note_id:
+            self.status_bar.showMessage(f"Note saved: {note['title']}")
     
     def on_note_deleted(self, note_id):
         """Handle note deletion.
@@ -0,0 +1,82 @@
+import os
+import tempfile
+import unittest
+from domain.entities.attachment import Attachment
+from domain.entities.note import Note
+from infrastructure.database.attachment_repository_impl import AttachmentRepositoryImpl
+from infrastructure.database.connection import MAX_IN_PARAMS
+from infrastructure.database.db_init import DatabaseInitializer
+from infrastructure.database.note_repository_impl import NoteRepositoryImpl
+
+class TestAttachmentRepository(unittest.TestCase):
+    """Test cases for attachment records and their files."""
+    
+    def setUp(self):
+        """Open a fresh in-memory database and a directory for attachment files."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.db = DatabaseInitializer(":memory:").initialize_database()
+        self.notes = NoteRepositoryImpl(self.db)
+        self.attachments = AttachmentRepositoryImpl(self.db)
+        self.note_id = self.notes.add_note(Note(title="note"))
+    
+    def tearDown(self):
+        """Close the database and remove the attachment files."""
+        self.db.close()
+        self.directory.cleanup()
+    
+    def attach(self, file_name, create_file=True):
+        """Attach a file to the test note and return the attachment ID and file path."""
+        file_path = os.path.join(self.directory.name, file_name)
+        if create_file:
+            open(file_path, "w").close()
+        
+        attachment_id = self.attachments.add_attachment(
+            Attachment(note_id=self.note_id, file_path=file_path, file_name=file_name, file_type="txt")
+        )
+        return attachment_id, file_path
+    
+    def test_delete_note_removes_attachments(self):
+        """Test that deleting a note drops its attachment rows and files, even if a file is already missing."""
+        _, present = self.attach("present.txt")
+        self.attach("missing.txt", create_file=False)
+        
+        self.assertTrue(self.notes.delete_note(self.note_id))
+        
+        self.assertEqual(self.attachments.get_attachments_for_note(self.note_id), [])
+        self.assertFalse(os.path.exists(present))
+    
+    def test_delete_attachments_for_note(self):
+        """Test that deleting a note's attachments keeps the note and removes the files."""
+        _, present = self.attach("present.txt")
+        self.attach("missing.txt", create_file=False)
+        
+        self.assertEqual(self.attachments.delete_attachments_for_note(self.note_id), 2)
+        
+        self.assertEqual(self.attachments.get_attachments_for_note(self.note_id), [])
+        self.assertFalse(os.path.exists(present))
+        self.assertIsNotNone(self.notes.get_note_by_id(self.note_id))
+    
+    def test_add_attachments_bulk_returns_ids_in_order(self):
+        """Test that bulk-added attachments get their IDs back in input order, across chunk boundaries."""
+        # Each row binds five parameters, so a chunk holds MAX_IN_PARAMS // 5 rows
+        rows_per_chunk = MAX_IN_PARAMS // 5
+        for count in (rows_per_chunk, rows_per_chunk + 1, rows_per_chunk * 2 + 3):
+            attachments = [
+                Attachment(note_id=self.note_id, file_path=f"{count}-{i}", file_name=f"{count}-{i}", file_type="txt")
+                for i in range(count)
+            ]
+            
+            attachment_ids = self.attachments.add_attachments_bulk(attachments)
+            
+            self.assertEqual(len(attachment_ids), count)
+            self.assertEqual(
+                [self.attachments.get_attachment_by_id(attachment_id).file_name for attachment_id in attachment_ids],
+                [attachment.file_name for attachment in attachments]
+            )
+    
+    def test_add_attachments_bulk_empty(self):
+        """Test that adding no attachments returns no IDs."""
+        self.assertEqual(self.attachments.add_attachments_bulk([]), [])
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,65 @@
+import unittest
+from domain.entities.folder import Folder
+from domain.entities.note import Note
+from infrastructure.database.db_init import DatabaseInitializer
+from infrastructure.database.folder_repository_impl import FolderRepositoryImpl
+from infrastructure.database.note_repository_impl import NoteRepositoryImpl
+
+class TestCreateFoldersBulk(unittest.TestCase):
+    """Test cases for FolderRepositoryImpl.create_folders_bulk."""
+    
+    def setUp(self):
+        """Open a fresh in-memory database."""
+        self.db = DatabaseInitializer(":memory:").initialize_database()
+        self.folders = FolderRepositoryImpl(self.db)
+        self.notes = NoteRepositoryImpl(self.db)
+        self.parent_id = self.folders.create_folder(Folder(name="parent"))
+    
+    def tearDown(self):
+        """Close the database."""
+        self.db.close()
+    
+    def folder_rows(self):
+        """Return every folder as a (path, parent_id, note_count) tuple, ordered by path."""
+        return self.db.execute("SELECT path, parent_id, note_count FROM folders ORDER BY path").fetchall()
+    
+    def test_paths_and_counts(self):
+        """Test that bulk-created folders get their full path and an empty note count."""
+        created = self.folders.create_folders_bulk([
+            Folder(name="top"),
+            Folder(name="child", parent_id=self.parent_id)
+        ])
+        
+        self.assertEqual(created, 2)
+        self.assertEqual(self.folder_rows(), [
+            ("/Geral", None, 1),
+            ("parent", None, 0),
+            ("parent/child", self.parent_id, 0),
+            ("top", None, 0)
+        ])
+        
+        # The note count triggers keep working for the new folders
+        child_id = self.db.execute("SELECT id FROM folders WHERE path = 'parent/child'").fetchone()[0]
+        self.notes.add_note(Note(title="note", folder_id=child_id))
+        self.assertEqual(self.folders.get_folder_note_count(child_id), 1)
+    
+    def test_duplicates_are_skipped(self):
+        """Test that names already taken by a sibling, in the database or earlier in the list, are skipped."""
+        created = self.folders.create_folders_bulk([
+            Folder(name="parent"),
+            Folder(name="Geral"),
+            Folder(name="child", parent_id=self.parent_id),
+            Folder(name="child", parent_id=self.parent_id),
+            Folder(name="parent", parent_id=self.parent_id)
+        ])
+        
+        self.assertEqual(created, 2)
+        self.assertEqual(self.folder_rows(), [
+            ("/Geral", None, 1),
+            ("parent", None, 0),
+            ("parent/child", self.parent_id, 0),
+            ("parent/parent", self.parent_id, 0)
+        ])
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,99 @@
+import unittest
+from datetime import datetime
+from domain.entities.event import Event
+from domain.entities.folder import Folder
+from domain.entities.note import Note
+from infrastructure.database.db_init import DatabaseInitializer
+from infrastructure.database.event_repository_impl import EventRepositoryImpl
+from infrastructure.database.folder_repository_impl import FolderRepositoryImpl
+from infrastructure.database.note_repository_impl import NoteRepositoryImpl
+
+class TestDatabaseConnection(unittest.TestCase):
+    """Test cases for DatabaseConnection batches."""
+    
+    def setUp(self):
+        """Open a fresh in-memory database for each test."""
+        self.db = DatabaseInitializer(":memory:").initialize_database()
+        self.folders = FolderRepositoryImpl(self.db)
+        self.notes = NoteRepositoryImpl(self.db)
+        self.events = EventRepositoryImpl(self.db)
+    
+    def tearDown(self):
+        """Close the database."""
+        self.db.close()
+    
+    def test_failed_write_keeps_rest_of_batch(self):
+        """Test that a caught failure inside a batch only undoes its own writes."""
+        first_id = self.folders.create_folder(Folder(name="a"))
+        second_id = self.folders.create_folder(Folder(name="b"))
+        
+        with self.db.batch():
+            first = self.notes.add_note(Note(title="first"))
+            
+            # Renaming onto a sibling's name fails
+            with self.assertRaises(ValueError):
+                self.folders.rename_folder(second_id, "a")
+            
+            # Moving into a folder that does not exist fails
+            self.assertFalse(self.notes.move_note(first, 9999))
+            
+            second = self.notes.add_note(Note(title="second"))
+        
+        self.assertNotEqual(first, second)
+        self.assertEqual(self.notes.get_note_by_id(first).title, "first")
+        self.assertEqual(self.notes.get_note_by_id(second).title, "second")
+        self.assertEqual(self.folders.get_folder_by_id(second_id).name, "b")
+        self.assertEqual(self.folders.get_folder_by_id(first_id).name, "a")
+    
+    def test_batch_rolls_back_on_error(self):
+        """Test that a batch that raises keeps none of its writes."""
+        with self.assertRaises(RuntimeError):
+            with self.db.batch():
+                note_id = self.notes.add_note(Note(title="lost"))
+                raise RuntimeError("abort")
+        
+        self.assertIsNone(self.notes.get_note_by_id(note_id))
+    
+    def test_bulk_writes_in_batch(self):
+        """Test that bulk writes inside a batch are committed together when it exits."""
+        with self.db.batch():
+            self.assertEqual(self.folders.create_folders_bulk([Folder(name="x"), Folder(name="y")]), 2)
+            self.assertEqual(self.notes.add_notes_bulk([Note(title="n1"), Note(title="n2")]), 2)
+            self.assertEqual(self.events.add_events_bulk([Event(title="e", date=datetime(2024, 5, 1))]), 1)
+            
+            # The bulk methods' own commits wait for the batch
+            self.assertTrue(self.db.in_transaction)
+        
+        self.assertFalse(self.db.in_transaction)
+        self.assertEqual(self.db.execute("SELECT COUNT(*) FROM folders WHERE name IN ('x', 'y')").fetchone()[0], 2)
+        self.assertEqual(self.db.execute("SELECT COUNT(*) FROM notes WHERE title IN ('n1', 'n2')").fetchone()[0], 2)
+        self.assertEqual(self.db.execute("SELECT COUNT(*) FROM events").fetchone()[0], 1)
+    
+    def test_bulk_writes_rolled_back_with_batch(self):
+        """Test that bulk writes are undone when the batch they run in raises."""
+        with self.assertRaises(RuntimeError):
+            with self.db.batch():
+                self.folders.create_folders_bulk([Folder(name="x")])
+                self.notes.add_notes_bulk([Note(title="n1")])
+                self.events.add_events_bulk([Event(title="e", date=datetime(2024, 5, 1))])
+                raise RuntimeError("abort")
+        
+        self.assertEqual(self.db.execute("SELECT COUNT(*) FROM folders WHERE name = 'x'").fetchone()[0], 0)
+        self.assertEqual(self.db.execute("SELECT COUNT(*) FROM notes WHERE title = 'n1'").fetchone()[0], 0)
+        self.assertEqual(self.db.execute("SELECT COUNT(*) FROM events").fetchone()[0], 0)
+    
+    def test_failed_write_outside_batch(self):
+        """Test that a failed write outside a batch leaves no transaction open."""
+        folder_id = self.folders.create_folder(Folder(name="a"))
+        other_id = self.folders.create_folder(Folder(name="b"))
+        
+        with self.assertRaises(ValueError):
+            self.folders.rename_folder(other_id, "a")
+        
+        self.assertFalse(self.db.in_transaction)
+        self.assertTrue(self.folders.rename_folder(folder_id, "c"))
+        self.assertFalse(self.db.in_transaction)
+        self.assertEqual(self.folders.get_folder_by_id(folder_id).name, "c")
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
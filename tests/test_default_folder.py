@@ -0,0 +1,50 @@
+import os
+import tempfile
+import unittest
+from application.use_cases.folder_service_impl import FolderServiceImpl
+from domain.entities.folder import Folder
+from infrastructure.database.db_init import DatabaseInitializer
+from infrastructure.database.folder_repository_impl import FolderRepositoryImpl
+
+class TestDefaultFolder(unittest.TestCase):
+    """Test cases for the protected default folder."""
+    
+    def setUp(self):
+        """Open a fresh database in a temporary directory."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.directory.name, "notes.db")
+        self.open_database()
+    
+    def tearDown(self):
+        """Close the database and remove its directory."""
+        self.db.close()
+        self.directory.cleanup()
+    
+    def open_database(self):
+        """Open the database and build the folder repository and service."""
+        self.db = DatabaseInitializer(self.db_path).initialize_database()
+        self.folders = FolderRepositoryImpl(self.db)
+        self.service = FolderServiceImpl(self.folders)
+    
+    def test_rename_is_blocked(self):
+        """Test that the default folder cannot be renamed through the service."""
+        default_id = self.folders.get_default_folder_id()
+        
+        self.assertFalse(self.service.rename_folder(default_id, "Zed"))
+        self.assertEqual(self.folders.get_folder_by_id(default_id).name, "Geral")
+    
+    def test_default_folder_is_not_found_by_name(self):
+        """Test that a new top-level folder named like the default one does not take its place."""
+        default_id = self.folders.get_default_folder_id()
+        
+        # Rename it below the service, as an older version allowed
+        self.assertTrue(self.folders.rename_folder(default_id, "Zed"))
+        self.service.create_folder("Geral")
+        
+        self.db.close()
+        self.open_database()
+        
+        self.assertEqual(self.folders.get_default_folder_id(), default_id)
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
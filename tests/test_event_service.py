@@ -0,0 +1,42 @@
+import unittest
+from datetime import date
+from application.use_cases.event_service_impl import EventServiceImpl
+from domain.value_objects.date_range import DateRange
+from infrastructure.database.db_init import DatabaseInitializer
+from infrastructure.database.event_repository_impl import EventRepositoryImpl
+
+class TestEventService(unittest.TestCase):
+    """Test cases for EventServiceImpl.get_dates_with_events."""
+    
+    def setUp(self):
+        """Open a fresh in-memory database."""
+        self.db = DatabaseInitializer(":memory:").initialize_database()
+        self.service = EventServiceImpl(EventRepositoryImpl(self.db))
+        self.may = DateRange(start_date=date(2024, 5, 1), end_date=date(2024, 5, 31))
+    
+    def tearDown(self):
+        """Close the database."""
+        self.db.close()
+    
+    def test_dates_in_range(self):
+        """Test that each date with events is listed once, in order, within the range."""
+        for event_date in (date(2024, 5, 20), date(2024, 5, 1), date(2024, 5, 20), date(2024, 6, 1)):
+            self.service.create_event("Event", "", event_date)
+        
+        self.assertEqual(self.service.get_dates_with_events(self.may), [date(2024, 5, 1), date(2024, 5, 20)])
+    
+    def test_cache_follows_changes(self):
+        """Test that the cached dates are refreshed after an event is created, updated or deleted."""
+        self.assertEqual(self.service.get_dates_with_events(self.may), [])
+        
+        event_id = self.service.create_event("Event", "", date(2024, 5, 10))
+        self.assertEqual(self.service.get_dates_with_events(self.may), [date(2024, 5, 10)])
+        
+        self.assertTrue(self.service.update_event(event_id, "Event", "", date(2024, 5, 12)))
+        self.assertEqual(self.service.get_dates_with_events(self.may), [date(2024, 5, 12)])
+        
+        self.assertTrue(self.service.delete_event(event_id))
+        self.assertEqual(self.service.get_dates_with_events(self.may), [])
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,35 @@
+import unittest
+from domain.entities.folder import Folder
+from infrastructure.database.db_init import DatabaseInitializer
+from infrastructure.database.folder_repository_impl import FolderRepositoryImpl
+
+class TestFolderTree(unittest.TestCase):
+    """Test cases for FolderRepositoryImpl.get_folder_tree."""
+    
+    def setUp(self):
+        """Open a fresh in-memory database."""
+        self.db = DatabaseInitializer(":memory:").initialize_database()
+        self.folders = FolderRepositoryImpl(self.db)
+    
+    def tearDown(self):
+        """Close the database."""
+        self.db.close()
+    
+    def test_tree_order(self):
+        """Test that the tree is in pre-order, with the default folder first."""
+        alpha_id = self.folders.create_folder(Folder(name="Alpha"))
+        self.folders.create_folder(Folder(name="a b"))
+        self.folders.create_folder(Folder(name="z", parent_id=alpha_id))
+        self.folders.create_folder(Folder(name="c", parent_id=alpha_id))
+        
+        tree = [(folder.path, depth) for folder, depth, _ in self.folders.get_folder_tree()]
+        self.assertEqual(tree, [
+            ("/Geral", 0),
+            ("Alpha", 0),
+            ("Alpha/c", 1),
+            ("Alpha/z", 1),
+            ("a b", 0)
+        ])
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
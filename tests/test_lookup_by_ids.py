@@ -0,0 +1,63 @@
+import unittest
+from domain.entities.attachment import Attachment
+from domain.entities.folder import Folder
+from domain.entities.note import Note
+from infrastructure.database.attachment_repository_impl import AttachmentRepositoryImpl
+from infrastructure.database.connection import MAX_IN_PARAMS
+from infrastructure.database.db_init import DatabaseInitializer
+from infrastructure.database.folder_repository_impl import FolderRepositoryImpl
+from infrastructure.database.note_repository_impl import NoteRepositoryImpl
+
+class TestLookupByIds(unittest.TestCase):
+    """Test cases for the note and folder lookups by a list of IDs."""
+    
+    def setUp(self):
+        """Open a fresh in-memory database with more rows than fit in one IN (...) list."""
+        self.db = DatabaseInitializer(":memory:").initialize_database()
+        self.notes = NoteRepositoryImpl(self.db)
+        self.folders = FolderRepositoryImpl(self.db)
+        self.attachments = AttachmentRepositoryImpl(self.db)
+        
+        count = MAX_IN_PARAMS * 2 + 1
+        with self.db.batch():
+            self.folders.create_folders_bulk([Folder(name=f"folder {i}") for i in range(count)])
+            self.notes.add_notes_bulk([Note(title=f"note {i}") for i in range(count)])
+        
+        self.folder_ids = [row[0] for row in self.db.execute("SELECT id FROM folders ORDER BY id")]
+        self.note_ids = [row[0] for row in self.db.execute("SELECT id FROM notes ORDER BY id")]
+    
+    def tearDown(self):
+        """Close the database."""
+        self.db.close()
+    
+    def test_notes_across_chunks(self):
+        """Test that notes from every chunk come back in the order of the requested IDs."""
+        note_ids = list(reversed(self.note_ids))
+        
+        notes = self.notes.get_notes_by_ids(note_ids)
+        
+        self.assertEqual([note.id for note in notes], note_ids)
+    
+    def test_notes_with_attachments_and_missing_ids(self):
+        """Test that attachment IDs are attached to their notes and unknown IDs are skipped."""
+        last_id = self.note_ids[-1]
+        attachment_id = self.attachments.add_attachment(
+            Attachment(note_id=last_id, file_path="a.pdf", file_name="a.pdf", file_type="pdf")
+        )
+        
+        notes = self.notes.get_notes_by_ids([last_id, 999999, self.note_ids[0]])
+        
+        self.assertEqual([note.id for note in notes], [last_id, self.note_ids[0]])
+        self.assertEqual(notes[0].attachment_ids, [attachment_id])
+        self.assertEqual(notes[1].attachment_ids, [])
+    
+    def test_folders_across_chunks(self):
+        """Test that folders from every chunk come back in the order of the requested IDs."""
+        folder_ids = self.folder_ids[MAX_IN_PARAMS:] + self.folder_ids[:MAX_IN_PARAMS]
+        
+        folders = self.folders.get_folders_by_ids(folder_ids + [999999])
+        
+        self.assertEqual([folder.id for folder in folders], folder_ids)
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,48 @@
+import unittest
+from domain.entities.note import Note
+from domain.value_objects.search_criteria import SearchCriteria
+from infrastructure.database.db_init import DatabaseInitializer
+from infrastructure.database.note_repository_impl import NoteRepositoryImpl
+
+class TestNoteSearch(unittest.TestCase):
+    """Test cases for NoteRepositoryImpl.search_notes."""
+    
+    def setUp(self):
+        """Open a fresh in-memory database with a few notes."""
+        self.db = DatabaseInitializer(":memory:").initialize_database()
+        self.notes = NoteRepositoryImpl(self.db)
+        self.subnotes_id = self.notes.add_note(Note(title="subnotes", content="a-b"))
+        self.other_id = self.notes.add_note(Note(title="Other", content="plain"))
+    
+    def tearDown(self):
+        """Close the database."""
+        self.db.close()
+    
+    def search(self, term, **kwargs):
+        """Return the ids of the notes found for a term."""
+        return [note.id for note in self.notes.search_notes(SearchCriteria(search_term=term, **kwargs))]
+    
+    def test_substring(self):
+        """Test that a term matches inside a word, ignoring case."""
+        self.assertEqual(self.search("otes"), [self.subnotes_id])
+        self.assertEqual(self.search("OTES"), [self.subnotes_id])
+        self.assertEqual(self.search("otes", include_title=False), [])
+    
+    def test_short_and_punctuation_terms(self):
+        """Test terms too short for the full-text index and punctuation-only terms."""
+        self.assertIn(self.subnotes_id, self.search("-", include_title=False))
+        self.assertEqual(self.search("a-b"), [self.subnotes_id])
+        self.assertIn(self.other_id, self.search("ot"))
+    
+    def test_case_sensitive(self):
+        """Test that a case-sensitive search matches the exact case only."""
+        self.assertEqual(self.search("Ot", case_sensitive=True), [self.other_id])
+        self.assertNotIn(self.other_id, self.search("ot", case_sensitive=True))
+    
+    def test_sorted_by_modified_date(self):
+        """Test that results are listed from the most recently modified."""
+        found = [note_id for note_id in self.search("o") if note_id in (self.subnotes_id, self.other_id)]
+        self.assertEqual(found, [self.other_id, self.subnotes_id])
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file